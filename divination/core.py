@@ -9,6 +9,14 @@ class Element(Enum):
     METAL = "金"
     WATER = "水"
 
+    @property
+    def code(self) -> int:
+        """Dense integer code (0-4) for indexing element tables"""
+        return _ELEMENT_CODES[self]
+
+
+_ELEMENT_CODES = {element: code for code, element in enumerate(Element)}
+
 
 class Polarity(Enum):
     """Yin-Yang polarity"""
@@ -75,7 +75,7 @@ class InteractiveQiMenChart:
     def _handle_palace_click(self, palace_number: int, event_data: Dict) -> Dict:
         """Handle palace click interaction"""
         self.state.selected_palace = palace_number
-        config = self.current_chart.configurations[palace_number]
+        config = self.current_chart.get_configuration(palace_number)
 
         # Log interaction
         self._log_interaction('palace_click', f'palace_{palace_number}', {
@@ -98,7 +98,7 @@ class InteractiveQiMenChart:
     def _handle_palace_hover(self, palace_number: int, event_data: Dict) -> Dict:
         """Handle palace hover interaction"""
         self.state.hover_palace = palace_number
-        config = self.current_chart.configurations[palace_number]
+        config = self.current_chart.get_configuration(palace_number)
 
         return {
             'action': 'palace_hover',
@@ -301,12 +301,13 @@ class InteractiveQiMenChart:
 
     def _find_related_palaces(self, palace_number: int) -> List[Dict]:
         """Find palaces with related energies"""
-        current_config = self.current_chart.configurations[palace_number]
+        current_config = self.current_chart.get_configuration(palace_number)
         related = []
 
-        for num, config in self.current_chart.configurations.items():
+        for num in range(1, 10):
             if num == palace_number:
                 continue
+            config = self.current_chart.get_configuration(num)
 
             relationship_strength = 0
             relationship_type = []
@@ -359,7 +360,7 @@ class InteractiveQiMenChart:
             for i in range(1, 13):  # Check next 12 hours
                 future_time = self.state.current_time + timedelta(hours=i)
                 future_chart = self._get_cached_chart(future_time)
-                future_config = future_chart.configurations[config.palace_number]
+                future_config = future_chart.get_configuration(config.palace_number)
 
                 if future_config.is_auspicious:
                     optimal_hours.append({
@@ -440,8 +441,8 @@ class InteractiveQiMenChart:
         }
 
         for palace_num in range(1, 10):
-            old_config = old_chart.configurations[palace_num]
-            new_config = new_chart.configurations[palace_num]
+            old_config = old_chart.get_configuration(palace_num)
+            new_config = new_chart.get_configuration(palace_num)
 
             palace_changes = {
                 'auspiciousness_changed': old_config.is_auspicious != new_config.is_auspicious,
@@ -507,7 +508,7 @@ class InteractiveQiMenChart:
             'favorable_directions': [d.value for d in chart.favorable_directions],
             'unfavorable_directions': [d.value for d in chart.unfavorable_directions],
             'configurations': {
-                str(num): {
+                str(config.palace_number): {
                     'palace_number': config.palace_number,
                     'gate': config.gate.value if config.gate else None,
                     'star': config.star.value if config.star else None,
@@ -519,7 +520,7 @@ class InteractiveQiMenChart:
                     'heavenly_stem': config.heavenly_stem.chinese if config.heavenly_stem else None,
                     'earthly_branch': config.earthly_branch.chinese if config.earthly_branch else None
                 }
-                for num, config in chart.configurations.items()
+                for config in map(chart.get_configuration, range(1, 10))
             }
         }
 
@@ -1163,7 +1164,7 @@ class InteractiveQiMenChart:
 
         for row in grid_layout:
             for palace_number in row:
-                config = self.current_chart.configurations[palace_number]
+                config = self.current_chart.get_configuration(palace_number)
 
                 if palace_number == 5:
                     # Center palace
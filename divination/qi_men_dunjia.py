@@ -1,14 +1,15 @@
 # qimen.py - Qi Men Dun Jia Implementation
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, NamedTuple
+from typing import Dict, List, Tuple, Optional, NamedTuple, Iterable, FrozenSet, Callable, Any
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 import math
 
 from .core import Element, Direction, Season, Polarity
 from .calendar import ChineseLunarCalendar, LunarDate, HeavenlyStem, EarthlyBranch
-from .trigrams import NinePalaces, Palace
+from .trigrams import Palace, get_nine_palaces
 
 
 class QiMenGate(Enum):
@@ -56,21 +57,35 @@ class TimeFrame(Enum):
     HOUR = "時家"  # Hourly
 
 
+# Auspicious stars and spirits used when evaluating a palace
+_AUSPICIOUS_STARS = frozenset({QiMenStar.FU, QiMenStar.XIN, QiMenStar.QIN})
+_AUSPICIOUS_SPIRITS = frozenset({QiMenSpirit.ZHIFU, QiMenSpirit.LIUHE, QiMenSpirit.JIUTIAN})
+
+
 @dataclass
 class QiMenConfiguration:
     """Complete configuration for one palace in Qi Men Dun Jia"""
     palace_number: int
     heavenly_stem: HeavenlyStem
     earthly_branch: EarthlyBranch
-    gate: QiMenGate
+    gate: Optional[QiMenGate]  # None for the center palace
     star: QiMenStar
-    spirit: QiMenSpirit
+    spirit: Optional[QiMenSpirit]  # None for the center palace
     element: Element
     is_auspicious: bool
     energy_quality: str
     strategic_application: str
 
 
+def _palace_configuration(configurations: Tuple[Optional[QiMenConfiguration], ...],
+                          palace_number: int) -> QiMenConfiguration:
+    """Configuration of a palace (1-9) in a palace-indexed configurations tuple"""
+    config = configurations[palace_number] if 1 <= palace_number <= 9 else None
+    if config is None:
+        raise ValueError(f"Palace number must be between 1 and 9, got {palace_number}")
+    return config
+
+
 @dataclass
 class QiMenChart:
     """Complete Qi Men Dun Jia chart"""
@@ -78,48 +93,62 @@ class QiMenChart:
     lunar_date: LunarDate
     time_frame: TimeFrame
     duty_chief_palace: int
-    configurations: Dict[int, QiMenConfiguration]
+    configurations: Tuple[Optional[QiMenConfiguration], ...]  # Indexed by palace number, slot 0 unused
     overall_pattern: str
     favorable_directions: List[Direction]
     unfavorable_directions: List[Direction]
     optimal_timing: str
     strategic_assessment: str
 
+    @cached_property
+    def favorable_str(self) -> str:
+        """Favorable directions as a comma-separated string"""
+        return ", ".join(d.value for d in self.favorable_directions)
+
+    @cached_property
+    def unfavorable_str(self) -> str:
+        """Unfavorable directions as a comma-separated string"""
+        return ", ".join(d.value for d in self.unfavorable_directions)
+
+    def get_configuration(self, palace_number: int) -> QiMenConfiguration:
+        """Get the configuration of a palace by its number (1-9)"""
+        return _palace_configuration(self.configurations, palace_number)
+
 
 class QiMenCalculator:
     """Complete Qi Men Dun Jia calculation system"""
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.calendar = ChineseLunarCalendar()
-        self.nine_palaces = NinePalaces()
+        self.nine_palaces = get_nine_palaces()
 
         # Initialize gate sequences
-        self.gate_sequence = [
+        self.gate_sequence: List[QiMenGate] = [
             QiMenGate.REST, QiMenGate.LIFE, QiMenGate.HARM, QiMenGate.BLOCK,
             QiMenGate.VIEW, QiMenGate.DEATH, QiMenGate.SHOCK, QiMenGate.OPEN
         ]
 
         # Initialize star sequences
-        self.star_sequence = [
+        self.star_sequence: List[QiMenStar] = [
             QiMenStar.PENGBIRD, QiMenStar.RENSEAL, QiMenStar.CHONG, QiMenStar.FU,
             QiMenStar.YINGBIRD, QiMenStar.RUIBIRD, QiMenStar.ZHU, QiMenStar.XIN, QiMenStar.QIN
         ]
 
         # Initialize spirit sequences
-        self.spirit_sequence = [
+        self.spirit_sequence: List[QiMenSpirit] = [
             QiMenSpirit.ZHIFU, QiMenSpirit.TENGSHE, QiMenSpirit.TAIYIN, QiMenSpirit.LIUHE,
             QiMenSpirit.BAIHU, QiMenSpirit.XUANWU, QiMenSpirit.JIUDI, QiMenSpirit.JIUTIAN
         ]
 
         # Palace movement sequences
-        self.yang_sequence = [1, 8, 3, 4, 9, 2, 7, 6]  # Yang time movement
-        self.yin_sequence = [1, 6, 7, 2, 9, 4, 3, 8]  # Yin time movement
+        self.yang_sequence: List[int] = [1, 8, 3, 4, 9, 2, 7, 6]  # Yang time movement
+        self.yin_sequence: List[int] = [1, 6, 7, 2, 9, 4, 3, 8]  # Yin time movement
 
         # Auspicious gates
-        self.auspicious_gates = {QiMenGate.REST, QiMenGate.LIFE, QiMenGate.OPEN}
+        self.auspicious_gates: FrozenSet[QiMenGate] = frozenset({QiMenGate.REST, QiMenGate.LIFE, QiMenGate.OPEN})
 
         # Gate attributes
-        self.gate_attributes = {
+        self.gate_attributes: Dict[QiMenGate, Dict[str, Any]] = {
             QiMenGate.REST: {
                 "element": Element.WATER,
                 "quality": "Withdrawal and recuperation, strategic pause",
@@ -162,32 +191,42 @@ class QiMenCalculator:
             }
         }
 
+        # Duty chief calculation per time frame
+        self._duty_dispatch: Dict[TimeFrame, Callable[[LunarDate], int]] = {
+            TimeFrame.YEAR: self._duty_year,
+            TimeFrame.MONTH: self._duty_month,
+            TimeFrame.DAY: self._duty_day,
+            TimeFrame.HOUR: self._duty_hour
+        }
+
     def calculate_duty_chief(self, lunar_date: LunarDate, time_frame: TimeFrame) -> int:
         """Calculate the Duty Chief (值符) position"""
+        return self._duty_dispatch[time_frame](lunar_date)
 
-        if time_frame == TimeFrame.HOUR:
-            # Hour-based calculation using day stem
-            day_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.day_stem)
-            hour_branch_index = self.calendar.earthly_branches.branches.index(lunar_date.hour_branch)
+    def _duty_hour(self, lunar_date: LunarDate) -> int:
+        """Hour-based calculation using day stem and hour branch"""
+        day_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.day_stem)
+        hour_branch_index = self.calendar.earthly_branches.branches.index(lunar_date.hour_branch)
 
-            # Complex calculation based on day stem and hour
-            base_position = (day_stem_index * 6 + hour_branch_index) % 8
-            return self.yang_sequence[base_position] if self._is_yang_time(lunar_date) else self.yin_sequence[
-                base_position]
+        # Complex calculation based on day stem and hour
+        base_position = (day_stem_index * 6 + hour_branch_index) % 8
+        return self.yang_sequence[base_position] if self._is_yang_time(lunar_date) else self.yin_sequence[
+            base_position]
 
-        elif time_frame == TimeFrame.DAY:
-            # Day-based calculation
-            day_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.day_stem)
-            return self.yang_sequence[day_stem_index % 8]
+    def _duty_day(self, lunar_date: LunarDate) -> int:
+        """Day-based calculation"""
+        day_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.day_stem)
+        return self.yang_sequence[day_stem_index % 8]
 
-        elif time_frame == TimeFrame.MONTH:
-            # Month-based calculation
-            month_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.month_stem)
-            return self.yang_sequence[month_stem_index % 8]
+    def _duty_month(self, lunar_date: LunarDate) -> int:
+        """Month-based calculation"""
+        month_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.month_stem)
+        return self.yang_sequence[month_stem_index % 8]
 
-        else:  # YEAR
-            year_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.year_stem)
-            return self.yang_sequence[year_stem_index % 8]
+    def _duty_year(self, lunar_date: LunarDate) -> int:
+        """Year-based calculation"""
+        year_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.year_stem)
+        return self.yang_sequence[year_stem_index % 8]
 
     def _is_yang_time(self, lunar_date: LunarDate) -> bool:
         """Determine if current time is yang or yin"""
@@ -256,7 +295,7 @@ class QiMenCalculator:
                                     spirit: QiMenSpirit) -> QiMenConfiguration:
         """Create complete configuration for one palace"""
 
-        palace = self.nine_palaces.get_palace_by_number(palace_number)
+        palace = self.nine_palaces.by_number[palace_number]
 
         # Determine heavenly stem and earthly branch for this palace
         # This is a complex calculation based on the time and palace position
@@ -293,21 +332,21 @@ class QiMenCalculator:
         gate_auspicious = gate in self.auspicious_gates
 
         # Auspicious stars
-        auspicious_stars = {QiMenStar.FU, QiMenStar.XIN, QiMenStar.QIN}
-        star_auspicious = star in auspicious_stars
+        star_auspicious = star in _AUSPICIOUS_STARS
 
         # Auspicious spirits
-        auspicious_spirits = {QiMenSpirit.ZHIFU, QiMenSpirit.LIUHE, QiMenSpirit.JIUTIAN}
-        spirit_auspicious = spirit in auspicious_spirits
+        spirit_auspicious = spirit in _AUSPICIOUS_SPIRITS
 
-        # Overall evaluation
-        return sum([gate_auspicious, star_auspicious, spirit_auspicious]) >= 2
+        # Overall evaluation: at least two of the three factors agree
+        return (gate_auspicious & star_auspicious) | (gate_auspicious & spirit_auspicious) | \
+            (star_auspicious & spirit_auspicious)
 
-    def analyze_chart_pattern(self, configurations: Dict[int, QiMenConfiguration]) -> str:
+    def analyze_chart_pattern(self, configurations: Tuple[Optional[QiMenConfiguration], ...]) -> str:
         """Analyze overall chart pattern"""
 
-        auspicious_count = sum(1 for config in configurations.values() if config.is_auspicious)
-        total_count = len(configurations)
+        palace_configurations = configurations[1:]
+        auspicious_count = sum(1 for config in palace_configurations if config is not None and config.is_auspicious)
+        total_count = len(palace_configurations)
 
         if auspicious_count >= total_count * 0.7:
             return "Highly Favorable - Multiple auspicious configurations support success"
@@ -318,7 +357,7 @@ class QiMenCalculator:
         else:
             return "Challenging Pattern - Significant obstacles require strategic patience"
 
-    def determine_favorable_directions(self, configurations: Dict[int, QiMenConfiguration]) -> Tuple[
+    def determine_favorable_directions(self, configurations: Tuple[Optional[QiMenConfiguration], ...]) -> Tuple[
         List[Direction], List[Direction]]:
         """Determine favorable and unfavorable directions"""
 
@@ -330,8 +369,8 @@ class QiMenCalculator:
             6: Direction.NORTH, 7: Direction.WEST, 8: Direction.NORTH, 9: Direction.SOUTH
         }
 
-        for palace_num, config in configurations.items():
-            if palace_num == 5:  # Skip center
+        for palace_num, config in enumerate(configurations[1:], 1):
+            if palace_num == 5 or config is None:  # Skip center
                 continue
 
             direction = direction_map.get(palace_num)
@@ -345,11 +384,11 @@ class QiMenCalculator:
 
         return favorable, unfavorable
 
-    def generate_strategic_assessment(self, configurations: Dict[int, QiMenConfiguration],
+    def generate_strategic_assessment(self, configurations: Tuple[Optional[QiMenConfiguration], ...],
                                       duty_chief_palace: int) -> str:
         """Generate strategic assessment"""
 
-        duty_config = configurations[duty_chief_palace]
+        duty_config = _palace_configuration(configurations, duty_chief_palace)
 
         assessment_parts = []
 
@@ -359,9 +398,10 @@ class QiMenCalculator:
         else:
             assessment_parts.append(f"Command center faces challenges in Palace {duty_chief_palace}")
 
-        # Gate analysis
-        assessment_parts.append(
-            f"Primary strategy follows {duty_config.gate.value} - {duty_config.strategic_application}")
+        # Gate analysis (the duty chief never sits in the gateless center palace)
+        if duty_config.gate is not None:
+            assessment_parts.append(
+                f"Primary strategy follows {duty_config.gate.value} - {duty_config.strategic_application}")
 
         # Overall energy
         assessment_parts.append(f"Energy quality: {duty_config.energy_quality}")
@@ -386,11 +426,11 @@ class QiMenCalculator:
         star_positions = self.calculate_star_positions(duty_chief_palace, lunar_date)
         spirit_positions = self.calculate_spirit_positions(duty_chief_palace, gate_positions)
 
-        # Create configurations for all palaces
-        configurations = {}
+        # Create configurations for all palaces, indexed by palace number
+        palace_configurations: List[Optional[QiMenConfiguration]] = [None]  # Slot 0 unused
         for palace_num in range(1, 10):
             if palace_num == 5:  # Center palace special handling
-                configurations[palace_num] = QiMenConfiguration(
+                palace_configurations.append(QiMenConfiguration(
                     palace_number=5,
                     heavenly_stem=lunar_date.day_stem,
                     earthly_branch=lunar_date.hour_branch,
@@ -401,14 +441,15 @@ class QiMenCalculator:
                     is_auspicious=True,
                     energy_quality="Central command, coordination point",
                     strategic_application="Overall coordination and balance"
-                )
+                ))
             else:
-                configurations[palace_num] = self.create_palace_configuration(
+                palace_configurations.append(self.create_palace_configuration(
                     palace_num, lunar_date,
                     gate_positions.get(palace_num, QiMenGate.REST),
                     star_positions.get(palace_num, QiMenStar.PENGBIRD),
                     spirit_positions.get(palace_num, QiMenSpirit.ZHIFU)
-                )
+                ))
+        configurations = tuple(palace_configurations)
 
         # Analyze chart
         overall_pattern = self.analyze_chart_pattern(configurations)
@@ -431,6 +472,24 @@ class QiMenCalculator:
             strategic_assessment=strategic_assessment
         )
 
+    def calculate_qi_men_charts_batch(self, times: Iterable[datetime],
+                                      time_frame: TimeFrame = TimeFrame.HOUR) -> List[QiMenChart]:
+        """Calculate Qi Men charts for many times, e.g. an hourly timeline"""
+
+        calculate = self.calculate_qi_men_chart
+        charts_by_time: Dict[datetime, QiMenChart] = {}
+        charts = []
+
+        for calculation_time in times:
+            # Repeated timestamps share one chart
+            chart = charts_by_time.get(calculation_time)
+            if chart is None:
+                chart = calculate(calculation_time, time_frame)
+                charts_by_time[calculation_time] = chart
+            charts.append(chart)
+
+        return charts
+
     def display_qi_men_chart(self, chart: QiMenChart) -> str:
         """Display formatted Qi Men Dun Jia chart"""
 
@@ -457,19 +516,20 @@ Palace Configurations:
 
         for row in grid_layout:
             for palace_num in row:
-                config = chart.configurations[palace_num]
-                if palace_num == 5:
+                config = chart.get_configuration(palace_num)
+                gate, spirit = config.gate, config.spirit
+                if gate is None or spirit is None:  # Center palace
                     result += f"Palace {palace_num} (Center): {config.star.value}\n"
                 else:
                     auspicious_mark = "✓" if config.is_auspicious else "✗"
-                    result += f"Palace {palace_num} {auspicious_mark}: {config.gate.value} | {config.star.value} | {config.spirit.value}\n"
+                    result += f"Palace {palace_num} {auspicious_mark}: {gate.value} | {config.star.value} | {spirit.value}\n"
             result += "\n"
 
         result += f"""
 Strategic Assessment: {chart.strategic_assessment}
 
-Favorable Directions: {', '.join([d.value for d in chart.favorable_directions])}
-Unfavorable Directions: {', '.join([d.value for d in chart.unfavorable_directions])}
+Favorable Directions: {chart.favorable_str}
+Unfavorable Directions: {chart.unfavorable_str}
 
 Optimal Timing: {chart.optimal_timing}
 """
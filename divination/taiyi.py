@@ -1,14 +1,17 @@
 # taiyi.py - Updated with English translations
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, NamedTuple
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Tuple, Optional, NamedTuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 import math
 
 from .core import Element, Direction, Season, Polarity
 from .calendar import ChineseLunarCalendar, LunarDate, HeavenlyStem, EarthlyBranch
-from .trigrams import NinePalaces, Palace, EightTrigrams, Trigram
+from .trigrams import Palace, Trigram, get_eight_trigrams, get_nine_palaces
 
 
 class TaiyiStar(Enum):
@@ -34,6 +37,80 @@ class TaiyiStar(Enum):
     TAIYUAN = "太元"  # Great Origin
 
 
+# Five Element generation and destruction cycles
+_GENERATION_CYCLE = {
+    Element.WOOD: Element.FIRE,
+    Element.FIRE: Element.EARTH,
+    Element.EARTH: Element.METAL,
+    Element.METAL: Element.WATER,
+    Element.WATER: Element.WOOD
+}
+
+_DESTRUCTION_CYCLE = {
+    Element.WOOD: Element.EARTH,
+    Element.EARTH: Element.WATER,
+    Element.WATER: Element.FIRE,
+    Element.FIRE: Element.METAL,
+    Element.METAL: Element.WOOD
+}
+
+
+def _elemental_harmony(stem_element: Element, palace_element: Element) -> float:
+    """Influence strength of one element acting on another"""
+    if stem_element == palace_element:
+        return 1.0  # Perfect harmony
+    elif _GENERATION_CYCLE[stem_element] == palace_element:
+        return 0.8  # Generating relationship
+    elif _GENERATION_CYCLE[palace_element] == stem_element:
+        return 0.7  # Being generated
+    elif _DESTRUCTION_CYCLE[stem_element] == palace_element:
+        return 0.3  # Destructive relationship
+    elif _DESTRUCTION_CYCLE[palace_element] == stem_element:
+        return 0.2  # Being destroyed
+    else:
+        return 0.5  # Neutral relationship
+
+
+# The Five Elements in their canonical order
+_ELEMENTS = tuple(Element)
+
+# Palace movement sequences (the center palace 5 is skipped)
+_FORWARD_PALACES = (1, 2, 3, 4, 6, 7, 8, 9)
+_REVERSE_PALACES = (9, 8, 7, 6, 4, 3, 2, 1)
+
+# Seasonal palace adjustment by lunar month (index 0 unused)
+_SEASONAL_ADJUSTMENTS = (
+    0,
+    0, 0, 1,  # Spring
+    1, 1, 2,  # Summer
+    2, 2, 3,  # Autumn
+    3, 3, 0  # Winter
+)
+
+# Peak influence hours: dawn, noon, dusk, midnight
+_PEAK_HOURS = frozenset({5, 11, 17, 23})
+
+# Day cycle influence for each lunar day (index 0 unused)
+_DAY_FACTORS = tuple(0.5 + 0.5 * math.sin(2 * math.pi * day / 30) for day in range(31))
+
+
+def _master_palace_number(base_palace: int, month: int, day: int) -> int:
+    """Palace number of the master star from the base palace and lunar month/day"""
+    month_adjustment = (month - 1) % 8
+    day_adjustment = (day - 1) % 8
+
+    adjusted_palace_index = (base_palace - 1 + month_adjustment + day_adjustment) % 8
+    return _FORWARD_PALACES[adjusted_palace_index]
+
+
+def _guest_palace_number(base_palace: int, hour: int, seasonal_adjustment: int) -> int:
+    """Palace number of the guest star from the base palace, hour and season"""
+    hour_adjustment = (hour // 2) % 8  # Each branch covers 2 hours
+
+    adjusted_palace_index = (base_palace - 1 + hour_adjustment + seasonal_adjustment) % 8
+    return _REVERSE_PALACES[adjusted_palace_index]
+
+
 class TaiyiCycle:
     """Represents a complete Taiyi cycle calculation"""
 
@@ -51,7 +128,7 @@ class TaiyiCycle:
         return ((year - self.start_year) // self.cycle_length) + 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccumulatedYears:
     """Taiyi accumulated years calculation (积年)"""
     total_years: int
@@ -63,7 +140,7 @@ class AccumulatedYears:
         return f"Accumulated Years: {self.total_years}, Cycles: {self.cycle_years}, Remainder: {self.remainder_years}, Palace Position: {self.palace_position}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaiyiStarPosition:
     """Position of a Taiyi star in the palace system"""
     star: TaiyiStar
@@ -76,7 +153,7 @@ class TaiyiStarPosition:
         return f"{self.star.value} ({star_type}) resides in {self.palace.chinese_name}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaiyiDivination:
     """Complete Taiyi divination result"""
     query_date: datetime
@@ -84,13 +161,33 @@ class TaiyiDivination:
     accumulated_years: AccumulatedYears
     master_star_position: TaiyiStarPosition
     guest_star_position: TaiyiStarPosition
-    active_palace: Palace
-    supporting_palaces: List[Palace]
-    conflicting_palaces: List[Palace]
+    supporting_palaces: Tuple[Palace, ...]
+    conflicting_palaces: Tuple[Palace, ...]
     overall_assessment: str
     strategic_guidance: str
-    timing_analysis: Dict[str, str]
-    elemental_influences: Dict[Element, float]
+    # Derived from the fields above, and unhashable, so left out of == and hash()
+    timing_analysis: Mapping[str, str] = field(compare=False)
+    elemental_influences: Mapping[Element, float] = field(compare=False)
+
+    def __post_init__(self):
+        # Divinations are cached and shared between callers, so their mappings are exposed read-only
+        object.__setattr__(self, "timing_analysis", MappingProxyType(self.timing_analysis))
+        object.__setattr__(self, "elemental_influences", MappingProxyType(self.elemental_influences))
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled, so rebuild the divination from plain dict copies
+        return TaiyiDivination, (
+            self.query_date, self.lunar_date, self.accumulated_years,
+            self.master_star_position, self.guest_star_position,
+            self.supporting_palaces, self.conflicting_palaces,
+            self.overall_assessment, self.strategic_guidance,
+            dict(self.timing_analysis), dict(self.elemental_influences)
+        )
+
+    @property
+    def active_palace(self) -> Palace:
+        """Palace where the main energy is focused: the master star's palace"""
+        return self.master_star_position.palace
 
     def __str__(self):
         return f"Taiyi Divine Calculation - {self.query_date.strftime('%Y-%m-%d %H:%M')}\n{self.overall_assessment}"
@@ -101,8 +198,8 @@ class TaiyiCalculator:
 
     def __init__(self):
         self.calendar = ChineseLunarCalendar()
-        self.nine_palaces = NinePalaces()
-        self.eight_trigrams = EightTrigrams()
+        self.nine_palaces = get_nine_palaces()
+        self.eight_trigrams = get_eight_trigrams()
 
         # Taiyi reference epoch: 1864 (甲子年)
         self.epoch_year = 1864
@@ -120,18 +217,44 @@ class TaiyiCalculator:
             TaiyiStar.TAIYIN, TaiyiStar.TIANYI, TaiyiStar.TAIYUAN
         ]
 
+        # Stem and branch positions, for direct index lookups
+        self._stem_index = {stem: i for i, stem in enumerate(self.calendar.heavenly_stems.stems)}
+        self._branch_index = {branch: i for i, branch in enumerate(self.calendar.earthly_branches.branches)}
+
+        # Elemental influence strength for every (stem, palace) element pair,
+        # indexed by stem element code, then palace element code
+        self._influence_matrix = tuple(
+            tuple(_elemental_harmony(stem_element, palace_element) for palace_element in Element)
+            for stem_element in Element
+        )
+
+        # Strategic application of each element, for guidance text
+        self._element_strategic = {
+            element: self.calendar.get_element_attributes(element)['strategic_application']
+            for element in Element
+        }
+
         # Palace movement patterns for different stars
         self.palace_sequences = {
-            "forward": [1, 2, 3, 4, 6, 7, 8, 9],  # Normal forward movement
-            "reverse": [9, 8, 7, 6, 4, 3, 2, 1],  # Reverse movement
+            "forward": list(_FORWARD_PALACES),  # Normal forward movement
+            "reverse": list(_REVERSE_PALACES),  # Reverse movement
             "center_out": [5, 1, 9, 2, 8, 3, 7, 4, 6],  # From center outward
         }
 
+        # Divinations are pure functions of the query time, so repeated
+        # queries (calendars, hour sweeps) are served from a bounded cache
+        self._cached_divination = lru_cache(maxsize=4096)(self._compute_divination)
+        self._cached_accumulated_years = lru_cache(maxsize=512)(self._compute_accumulated_years)
+
     def calculate_accumulated_years(self, target_year: int) -> AccumulatedYears:
         """
         Calculate the Taiyi accumulated years (积年) for a given year
         This is the foundational calculation for all Taiyi divination
         """
+        return self._cached_accumulated_years(target_year)
+
+    def _compute_accumulated_years(self, target_year: int) -> AccumulatedYears:
+        """Compute the accumulated years without consulting the cache"""
         total_years = target_year - self.epoch_year
 
         # Taiyi uses a 72-year cycle divided into 8 palace positions
@@ -141,7 +264,7 @@ class TaiyiCalculator:
         # Calculate palace position based on remainder
         # Each palace governs 9 years in the cycle
         palace_cycle_position = (remainder_years // 9) % 8
-        palace_position = self.palace_sequences["forward"][palace_cycle_position]
+        palace_position = _FORWARD_PALACES[palace_cycle_position]
 
         return AccumulatedYears(
             total_years=total_years,
@@ -155,17 +278,13 @@ class TaiyiCalculator:
         """Calculate the position of the master star (主星)"""
 
         # Master star selection based on year stem
-        year_stem_index = self.calendar.heavenly_stems.stems.index(lunar_date.year_stem)
+        year_stem_index = self._stem_index[lunar_date.year_stem]
         master_star = self.master_star_sequence[year_stem_index % len(self.master_star_sequence)]
 
         # Palace calculation incorporating multiple factors
-        base_palace = accumulated_years.palace_position
-        month_adjustment = (lunar_date.month - 1) % 8
-        day_adjustment = (lunar_date.day - 1) % 8
-
-        # Complex palace calculation
-        adjusted_palace_index = (base_palace - 1 + month_adjustment + day_adjustment) % 8
-        final_palace_number = self.palace_sequences["forward"][adjusted_palace_index]
+        final_palace_number = _master_palace_number(
+            accumulated_years.palace_position, lunar_date.month, lunar_date.day
+        )
 
         palace = self.nine_palaces.get_palace_by_number(final_palace_number)
 
@@ -186,16 +305,13 @@ class TaiyiCalculator:
         """Calculate the position of the guest star (客星)"""
 
         # Guest star selection based on day branch
-        day_branch_index = self.calendar.earthly_branches.branches.index(lunar_date.day_branch)
+        day_branch_index = self._branch_index[lunar_date.day_branch]
         guest_star = self.guest_star_sequence[day_branch_index % len(self.guest_star_sequence)]
 
         # Guest star moves more dynamically, incorporating hour
-        base_palace = accumulated_years.palace_position
-        hour_adjustment = (hour // 2) % 8  # Each branch covers 2 hours
-        seasonal_adjustment = self._get_seasonal_adjustment(lunar_date.month)
-
-        adjusted_palace_index = (base_palace - 1 + hour_adjustment + seasonal_adjustment) % 8
-        final_palace_number = self.palace_sequences["reverse"][adjusted_palace_index]
+        final_palace_number = _guest_palace_number(
+            accumulated_years.palace_position, hour, self._get_seasonal_adjustment(lunar_date.month)
+        )
 
         palace = self.nine_palaces.get_palace_by_number(final_palace_number)
 
@@ -211,87 +327,42 @@ class TaiyiCalculator:
 
     def _calculate_influence_strength(self, stem_element: Element, palace_element: Element) -> float:
         """Calculate the influence strength based on elemental relationships"""
-
-        # Five Element generation and destruction cycles
-        generation_cycle = {
-            Element.WOOD: Element.FIRE,
-            Element.FIRE: Element.EARTH,
-            Element.EARTH: Element.METAL,
-            Element.METAL: Element.WATER,
-            Element.WATER: Element.WOOD
-        }
-
-        destruction_cycle = {
-            Element.WOOD: Element.EARTH,
-            Element.EARTH: Element.WATER,
-            Element.WATER: Element.FIRE,
-            Element.FIRE: Element.METAL,
-            Element.METAL: Element.WOOD
-        }
-
-        if stem_element == palace_element:
-            return 1.0  # Perfect harmony
-        elif generation_cycle.get(stem_element) == palace_element:
-            return 0.8  # Generating relationship
-        elif generation_cycle.get(palace_element) == stem_element:
-            return 0.7  # Being generated
-        elif destruction_cycle.get(stem_element) == palace_element:
-            return 0.3  # Destructive relationship
-        elif destruction_cycle.get(palace_element) == stem_element:
-            return 0.2  # Being destroyed
-        else:
-            return 0.5  # Neutral relationship
+        return self._influence_matrix[stem_element.code][palace_element.code]
 
     def _calculate_time_based_influence(self, hour: int, day: int) -> float:
         """Calculate influence strength based on temporal factors"""
-        # Peak influence during certain hours
-        peak_hours = [5, 11, 17, 23]  # Dawn, noon, dusk, midnight
-        hour_factor = 1.0 if hour in peak_hours else 0.6
-
-        # Day cycle influence
-        day_factor = 0.5 + 0.5 * math.sin(2 * math.pi * day / 30)
-
-        return min(1.0, hour_factor * day_factor)
+        hour_factor = 1.0 if hour in _PEAK_HOURS else 0.6
+        return min(1.0, hour_factor * _DAY_FACTORS[day])
 
     def _get_seasonal_adjustment(self, month: int) -> int:
         """Get seasonal adjustment for palace calculations"""
-        seasonal_adjustments = {
-            1: 0, 2: 0, 3: 1,  # Spring
-            4: 1, 5: 1, 6: 2,  # Summer
-            7: 2, 8: 2, 9: 3,  # Autumn
-            10: 3, 11: 3, 12: 0  # Winter
-        }
-        return seasonal_adjustments.get(month, 0)
+        return _SEASONAL_ADJUSTMENTS[month] if 1 <= month <= 12 else 0
 
     def analyze_palace_relationships(self, master_position: TaiyiStarPosition,
-                                     guest_position: TaiyiStarPosition) -> Tuple[List[Palace], List[Palace]]:
+                                     guest_position: TaiyiStarPosition) -> Tuple[Tuple[Palace, ...], Tuple[Palace, ...]]:
         """Analyze supporting and conflicting palace relationships"""
 
-        supporting_palaces = []
-        conflicting_palaces = []
-
         master_palace = master_position.palace
         guest_palace = guest_position.palace
+        palaces = self.nine_palaces.palaces
+        palace_element_codes = self.nine_palaces.palace_element_codes
+
+        # Elemental relationships of the master and guest palaces with every
+        # palace, read through the palace element code column
+        master_influences = self._influence_matrix[master_palace.element.code]
+        guest_influences = self._influence_matrix[guest_palace.element.code]
+        master_row = [master_influences[code] for code in palace_element_codes]
+        guest_row = [guest_influences[code] for code in palace_element_codes]
+
+        # Average harmony of every palace other than the master and guest palaces
+        averages = [
+            (palace, (master_harmony + guest_harmony) / 2)
+            for palace, master_harmony, guest_harmony in zip(palaces, master_row, guest_row)
+            if palace is not master_palace and palace is not guest_palace
+        ]
 
-        # Analyze all palaces for relationships
-        for palace in self.nine_palaces.palaces:
-            if palace == master_palace or palace == guest_palace:
-                continue
-
-            # Check elemental relationships
-            master_harmony = self._calculate_influence_strength(
-                master_palace.element, palace.element
-            )
-            guest_harmony = self._calculate_influence_strength(
-                guest_palace.element, palace.element
-            )
-
-            average_harmony = (master_harmony + guest_harmony) / 2
-
-            if average_harmony >= 0.7:
-                supporting_palaces.append(palace)
-            elif average_harmony <= 0.3:
-                conflicting_palaces.append(palace)
+        supporting_palaces = tuple(palace for palace, average in averages if average >= 0.7)
+        conflicting_palaces = tuple(palace for palace, average in averages if average <= 0.3)
 
         return supporting_palaces, conflicting_palaces
 
@@ -300,7 +371,7 @@ class TaiyiCalculator:
                                        lunar_date: LunarDate) -> Dict[Element, float]:
         """Calculate the influence of each element in the current configuration"""
 
-        influences = {element: 0.0 for element in Element}
+        influences = dict.fromkeys(_ELEMENTS, 0.0)
 
         # Master star influence
         influences[master_position.palace.element] += master_position.influence_strength * 0.4
@@ -323,8 +394,8 @@ class TaiyiCalculator:
 
     def generate_overall_assessment(self, master_position: TaiyiStarPosition,
                                     guest_position: TaiyiStarPosition,
-                                    supporting_palaces: List[Palace],
-                                    conflicting_palaces: List[Palace]) -> str:
+                                    supporting_palaces: Sequence[Palace],
+                                    conflicting_palaces: Sequence[Palace]) -> str:
         """Generate overall assessment of the Taiyi configuration"""
 
         assessment_parts = []
@@ -363,9 +434,8 @@ class TaiyiCalculator:
         guidance_parts.append(f"Supporting strategy: {guest_position.palace.strategic_use}")
 
         # Elemental guidance
-        dominant_element = max(elemental_influences.keys(), key=lambda x: elemental_influences[x])
-        element_attributes = self.calendar.get_element_attributes(dominant_element)
-        guidance_parts.append(f"Elemental guidance: {element_attributes['strategic_application']}")
+        dominant_element = max(elemental_influences.items(), key=itemgetter(1))[0]
+        guidance_parts.append(f"Elemental guidance: {self._element_strategic[dominant_element]}")
 
         return "; ".join(guidance_parts) + "."
 
@@ -382,6 +452,27 @@ class TaiyiCalculator:
 
     def perform_divination(self, query_date: datetime) -> TaiyiDivination:
         """Perform complete Taiyi divination for a given date and time"""
+        return self._cached_divination(query_date)
+
+    def perform_divination_range(self, start: datetime, end: datetime,
+                                 step_hours: int = 24) -> List[TaiyiDivination]:
+        """Perform divinations from start up to (but excluding) end at a fixed hour step"""
+        if step_hours <= 0:
+            raise ValueError("step_hours must be positive")
+
+        step = timedelta(hours=step_hours)
+        divine = self.perform_divination
+        divinations = []
+
+        query_date = start
+        while query_date < end:
+            divinations.append(divine(query_date))
+            query_date += step
+
+        return divinations
+
+    def _compute_divination(self, query_date: datetime) -> TaiyiDivination:
+        """Compute a Taiyi divination without consulting the cache"""
 
         # Convert to lunar date
         lunar_date = self.calendar.gregorian_to_lunar(query_date)
@@ -393,9 +484,6 @@ class TaiyiCalculator:
         master_position = self.calculate_master_star_position(accumulated_years, lunar_date)
         guest_position = self.calculate_guest_star_position(accumulated_years, lunar_date, query_date.hour)
 
-        # Determine active palace (where the main energy is focused)
-        active_palace = master_position.palace
-
         # Analyze palace relationships
         supporting_palaces, conflicting_palaces = self.analyze_palace_relationships(
             master_position, guest_position
@@ -423,7 +511,6 @@ class TaiyiCalculator:
             accumulated_years=accumulated_years,
             master_star_position=master_position,
             guest_star_position=guest_position,
-            active_palace=active_palace,
             supporting_palaces=supporting_palaces,
             conflicting_palaces=conflicting_palaces,
             overall_assessment=overall_assessment,
@@ -435,7 +522,14 @@ class TaiyiCalculator:
     def display_divination_result(self, divination: TaiyiDivination) -> str:
         """Display formatted Taiyi divination result"""
 
-        result = f"""
+        elemental_lines = "\n".join(
+            f"  {element.value}: {influence:.2f}" for element, influence in divination.elemental_influences.items()
+        )
+        timing_lines = "\n".join(
+            f"  {period}: {analysis}" for period, analysis in divination.timing_analysis.items()
+        )
+
+        return f"""
 Taiyi Divine Calculation Result
 {'=' * 50}
 
@@ -455,12 +549,8 @@ Supporting Palaces: {', '.join([p.chinese_name for p in divination.supporting_pa
 Conflicting Palaces: {', '.join([p.chinese_name for p in divination.conflicting_palaces])}
 
 Elemental Influences:
-"""
+{elemental_lines}
 
-        for element, influence in divination.elemental_influences.items():
-            result += f"  {element.value}: {influence:.2f}\n"
-
-        result += f"""
 Overall Assessment:
 {divination.overall_assessment}
 
@@ -468,9 +558,5 @@ Strategic Guidance:
 {divination.strategic_guidance}
 
 Timing Analysis:
+{timing_lines}
 """
-
-        for period, analysis in divination.timing_analysis.items():
-            result += f"  {period}: {analysis}\n"
-
-        return result
\ No newline at end of file
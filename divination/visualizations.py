@@ -1,154 +1,330 @@
 # visualizations.py - Chart visualization module for Chinese divination systems
 
+import io
 import math
+import os
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 
 from .qi_men_dunjia import QiMenChart, QiMenConfiguration
 from .taiyi import TaiyiDivination, TaiyiStarPosition
 from .core import Direction, Element, TranslationDict
 
 
-class ChartVisualizer:
-    """Main visualization class for divination charts"""
-    
-    def __init__(self):
-        self.translator = TranslationDict()
-        
-    def render_qimen_ascii(self, chart: QiMenChart, show_stems_branches: bool = False) -> str:
-        """Render Qi Men Dun Jia chart in beautiful ASCII format"""
+# Box-drawing frame lines shared by the ASCII renderers
+_DOUBLE_TOP = "╔" + "═" * 67 + "╗"
+_DOUBLE_RULE = "╠" + "═" * 67 + "╣"
+_DOUBLE_BOTTOM = "╚" + "═" * 67 + "╝"
+_HEAVY_TOP = "┏" + "━" * 90 + "┓"
+_HEAVY_RULE = "┣" + "━" * 90 + "┫"
+_HEAVY_BOTTOM = "┗" + "━" * 90 + "┛"
+_HEAVY_TOP_LINE = _HEAVY_TOP + "\n"
+_HEAVY_RULE_LINE = _HEAVY_RULE + "\n"
+
+# Lo Shu palace order, top row (SE, S, SW) to bottom row (NE, N, NW)
+_LO_SHU_LAYOUT: Tuple[Tuple[int, int, int], ...] = ((4, 9, 2), (3, 5, 7), (8, 1, 6))
+_LO_SHU_FLAT: Tuple[int, ...] = (4, 9, 2, 3, 5, 7, 8, 1, 6)
+
+# Every possible 20-character influence bar, indexed by filled length
+_BAR_LUT = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Qi Men ASCII chart frame; grid row borders are indexed by "is first row"
+_QIMEN_ASCII_RULE = "+" + "=" * 67 + "+"
+_QIMEN_ASCII_HEADER = (
+    _QIMEN_ASCII_RULE,
+    "|                    Qi Men Dun Jia Chart                        |",
+    _QIMEN_ASCII_RULE,
+)
+_QIMEN_ASCII_ROW_BORDERS = (
+    "║ ├─────────────────┼─────────────────┼─────────────────┤ ║",
+    "║ ┌─────────────────┬─────────────────┬─────────────────┐ ║",
+)
+_QIMEN_ASCII_GRID_BOTTOM = "║ └─────────────────┴─────────────────┴─────────────────┘ ║"
+
+# Qi Men detailed chart frame
+_QIMEN_DETAILED_HEADER = (
+    _HEAVY_TOP,
+    "┃                           奇門遁甲 QI MEN DUN JIA CHART                              ┃",
+    _HEAVY_RULE,
+)
+_QIMEN_DETAILED_ROW_BORDERS = (
+    "┃ ┠─────────────────────────┼─────────────────────────┼─────────────────────────┨ ┃",
+    "┃ ┌─────────────────────────┬─────────────────────────┬─────────────────────────┐ ┃",
+)
+_QIMEN_DETAILED_GRID_BOTTOM = "┃ └─────────────────────────┴─────────────────────────┴─────────────────────────┘ ┃"
+
+# Qi Men HTML document start; {time} is the chart time
+_QIMEN_HTML_HEAD_TMPL = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Qi Men Dun Jia Chart - {time}</title>
+    <style>
+"""
+
+# Qi Men HTML stylesheet and page header, identical for every chart
+_QIMEN_HTML_STYLE = """        body { font-family: 'Microsoft YaHei', SimSun, serif; background-color: #f5f5dc; }
+        .chart-container { max-width: 800px; margin: 20px auto; }
+        .chart-title { text-align: center; font-size: 24px; font-weight: bold; color: #8B4513; margin-bottom: 20px; }
+        .qimen-grid { display: grid; grid-template-columns: 1fr 1fr 1fr; grid-gap: 2px; background-color: #8B4513; border: 3px solid #8B4513; }
+        .palace { background-color: white; padding: 15px; min-height: 120px; position: relative; }
+        .palace.center { background-color: #fffacd; }
+        .palace.auspicious { border-left: 5px solid #228B22; }
+        .palace.inauspicious { border-left: 5px solid #DC143C; }
+        .palace-number { font-weight: bold; font-size: 14px; color: #8B4513; }
+        .gate { color: #DC143C; font-weight: bold; }
+        .star { color: #4169E1; font-weight: bold; }
+        .spirit { color: #9932CC; font-weight: bold; }
+        .info-panel { margin-top: 20px; padding: 15px; background-color: white; border: 1px solid #8B4513; }
+    </style>
+</head>
+<body>
+    <div class="chart-container">
+        <div class="chart-title">奇門遁甲 Qi Men Dun Jia Chart</div>
+"""
+
+# Qi Men HTML chart info line, opening the palace grid
+_QIMEN_HTML_TITLE_TMPL = """        <div style="text-align: center; margin-bottom: 15px;">
+            Time: {time} | 
+            Lunar: {year}/{month}/{day} |
+            Duty Chief: Palace {duty_chief}
+        </div>
         
-        # Grid layout: Traditional Lo Shu arrangement
-        grid_layout = [
-            [4, 9, 2],  # Top row (SE, S, SW)
-            [3, 5, 7],  # Middle row (E, Center, W)  
-            [8, 1, 6]   # Bottom row (NE, N, NW)
-        ]
+        <div class="qimen-grid">
+"""
+
+# Taiyi HTML document start; {time} is the query time
+_TAIYI_HTML_HEAD_TMPL = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Taiyi Divine Number - {time}</title>
+    <style>
+"""
+
+# Taiyi HTML stylesheet and page header, identical for every divination
+_TAIYI_HTML_STYLE = """        body { font-family: 'Microsoft YaHei', SimSun, serif; background-color: #1a1a2e; color: #eee; }
+        .chart-container { max-width: 900px; margin: 20px auto; }
+        .chart-title { text-align: center; font-size: 28px; font-weight: bold; color: #ffd700; margin-bottom: 20px; }
+        .circular-chart { position: relative; width: 500px; height: 500px; margin: 0 auto; }
+        .palace { position: absolute; width: 80px; height: 80px; border: 2px solid #ffd700; border-radius: 50%; 
+                   background-color: #16213e; display: flex; flex-direction: column; align-items: center; 
+                   justify-content: center; font-size: 12px; text-align: center; }
+        .palace.master-star { background-color: #ff6b6b; border-color: #ff6b6b; color: white; }
+        .palace.guest-star { background-color: #4ecdc4; border-color: #4ecdc4; color: white; }
+        .palace.center { width: 100px; height: 100px; background-color: #ffd700; color: #1a1a2e; font-weight: bold; }
+        .star-info { margin: 20px 0; padding: 20px; background-color: #16213e; border-radius: 10px; }
+        .element-bar { display: flex; align-items: center; margin: 5px 0; }
+        .element-name { width: 60px; }
+        .bar { height: 20px; background-color: #333; border-radius: 10px; flex-grow: 1; margin: 0 10px; position: relative; }
+        .bar-fill { height: 100%; border-radius: 10px; }
+        .wood { background-color: #228B22; }
+        .fire { background-color: #DC143C; }
+        .earth { background-color: #DAA520; }
+        .metal { background-color: #C0C0C0; }
+        .water { background-color: #4169E1; }
+    </style>
+</head>
+<body>
+    <div class="chart-container">
+        <div class="chart-title">太乙神數 Taiyi Divine Number</div>
+"""
+
+# Taiyi HTML query info line, opening the circular chart with its center palace
+_TAIYI_HTML_TITLE_TMPL = """        <div style="text-align: center; margin-bottom: 30px; font-size: 16px;">
+            Query: {query} | 
+            Lunar: {year}/{month}/{day} |
+            Accumulated Years: {accumulated_years}
+        </div>
         
-        result = []
-        result.append("+" + "=" * 67 + "+")
-        result.append("|                    Qi Men Dun Jia Chart                        |")
-        result.append("+" + "=" * 67 + "+")
-        result.append(f"| Time: {chart.calculation_time.strftime('%Y-%m-%d %H:%M')}    Duty Chief: Palace {chart.duty_chief_palace}    |")
-        result.append("+" + "=" * 67 + "+")
-        
-        # Create the 3x3 grid
-        for row_idx, row in enumerate(grid_layout):
+        <div class="circular-chart">
+            <!-- Center Palace -->
+            <div class="palace center" style="top: 210px; left: 210px;">
+                <div>中宮</div>
+                <div>CENTER</div>
+            </div>
+"""
+
+# Taiyi palace markers in circular arrangement: (number, top, left, name)
+_TAIYI_PALACE_POSITIONS = (
+    (1, "50px", "210px", "坎宮<br>North"),     # North
+    (2, "350px", "110px", "坤宮<br>SW"),      # Southwest
+    (3, "210px", "350px", "震宮<br>East"),    # East
+    (4, "350px", "310px", "巽宮<br>SE"),      # Southeast
+    (6, "50px", "110px", "乾宮<br>NW"),       # Northwest
+    (7, "210px", "50px", "兌宮<br>West"),     # West
+    (8, "50px", "310px", "艮宮<br>NE"),       # Northeast
+    (9, "350px", "210px", "離宮<br>South"),   # South
+)
+
+# Palace <div> per number; only the star class varies per render
+_TAIYI_PALACE_DIVS: Dict[int, str] = {
+    palace_num: f"""
+            <div class="palace {{star_class}}" style="top: {top}; left: {left};">
+                <div>{palace_num}</div>
+                <div>{name}</div>
+            </div>
+"""
+    for palace_num, top, left, name in _TAIYI_PALACE_POSITIONS
+}
+
+# Taiyi HTML document end
+_TAIYI_HTML_TAIL = """
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _boxed(prefix: str, body: str, width: int, suffix: str = " ║") -> str:
+    """Build a framed text line with body left-aligned to width"""
+    return prefix + body.ljust(width) + suffix
+
+
+@lru_cache(maxsize=128)
+def _qimen_ascii_impl(chart_key: tuple) -> str:
+    """Render the ASCII Qi Men chart from a hashable snapshot of the chart"""
+    time_str, duty_chief_palace, palaces, overall_pattern, fav_str, strategic_assessment = chart_key
+    
+    result = list(_QIMEN_ASCII_HEADER)
+    result.append(f"| Time: {time_str}    Duty Chief: Palace {duty_chief_palace}    |")
+    result.append(_QIMEN_ASCII_RULE)
+    
+    # Create the 3x3 grid
+    for idx, (palace_num, gate, star, spirit, is_auspicious) in enumerate(palaces):
+        row_idx, col_idx = divmod(idx, 3)
+        if col_idx == 0:
             # Top border of palaces
-            if row_idx == 0:
-                result.append("║ ┌─────────────────┬─────────────────┬─────────────────┐ ║")
-            else:
-                result.append("║ ├─────────────────┼─────────────────┼─────────────────┤ ║")
+            result.append(_QIMEN_ASCII_ROW_BORDERS[row_idx == 0])
             
             # Palace content - 4 lines per palace for detailed info
-            palace_lines = [[], [], [], []]
-            
-            for col_idx, palace_num in enumerate(row):
-                config = chart.configurations[palace_num]
-                
-                # Line 1: Palace number and auspiciousness
-                if palace_num == 5:
-                    palace_lines[0].append(f" Palace {palace_num} 中宮  ")
-                else:
-                    auspicious = "吉" if config.is_auspicious else "凶"
-                    palace_lines[0].append(f" Palace {palace_num} {auspicious}   ")
-                
-                # Line 2: Gate (or center indicator)
-                if palace_num == 5:
-                    palace_lines[1].append(f" ⚬ CENTER ⚬     ")
-                else:
-                    gate_short = config.gate.value[:2] if config.gate else "──"
-                    palace_lines[1].append(f" 門:{gate_short}         ")
-                
-                # Line 3: Star
-                if config.star:
-                    star_short = config.star.value[:2]
-                    palace_lines[2].append(f" 星:{star_short}         ")
-                else:
-                    palace_lines[2].append(" ──────         ")
-                
-                # Line 4: Spirit
-                if palace_num != 5 and config.spirit:
-                    spirit_short = config.spirit.value[:2]
-                    palace_lines[3].append(f" 神:{spirit_short}         ")
-                else:
-                    palace_lines[3].append("               ")
-            
-            # Add the 4 lines for this row of palaces
+            palace_lines = line0, line1, line2, line3 = [], [], [], []
+        
+        # Lines 1-2: Palace number and auspiciousness, then gate (or center indicator)
+        if palace_num == 5:
+            line0.append(" Palace 5 中宮  ")
+            line1.append(" ⚬ CENTER ⚬     ")
+        else:
+            line0.append(f" Palace {palace_num} {'吉' if is_auspicious else '凶'}   ")
+            line1.append(f" 門:{gate[:2] if gate else '──'}         ")
+        
+        # Lines 3-4: Star and spirit (the center palace shows no spirit)
+        line2.append(f" 星:{star[:2]}         " if star else " ──────         ")
+        line3.append(f" 神:{spirit[:2]}         " if palace_num != 5 and spirit else "               ")
+        
+        # Add the 4 lines once the row of palaces is complete
+        if col_idx == 2:
             for line_set in palace_lines:
                 line = "║ │" + "│".join(line_set) + "│ ║"
                 result.append(line)
+    
+    # Bottom border
+    result.append(_QIMEN_ASCII_GRID_BOTTOM)
+    result.append(_DOUBLE_RULE)
+    
+    # Summary information
+    result.append(_boxed("║ Pattern: ", overall_pattern[:50], 50))
+    result.append(_boxed("║ Favorable: ", fav_str, 53))
+    result.append(_boxed("║ Strategy: ", strategic_assessment[:51], 51))
+    result.append(_DOUBLE_BOTTOM)
+    
+    return "\n".join(result)
+
+
+class ChartVisualizer:
+    """Main visualization class for divination charts"""
+    
+    def __init__(self):
+        self.translator = TranslationDict()
         
-        # Bottom border
-        result.append("║ └─────────────────┴─────────────────┴─────────────────┘ ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
-        
-        # Summary information
-        result.append(f"║ Pattern: {chart.overall_pattern[:50]:<50} ║")
-        result.append(f"║ Favorable: {', '.join([d.value for d in chart.favorable_directions]):<53} ║")
-        result.append(f"║ Strategy: {chart.strategic_assessment[:51]:<51} ║")
-        result.append("╚═══════════════════════════════════════════════════════════════════╝")
+    def render_qimen_ascii(self, chart: QiMenChart, show_stems_branches: bool = False) -> str:
+        """Render Qi Men Dun Jia chart in beautiful ASCII format"""
         
-        return "\n".join(result)
+        get_configuration = chart.get_configuration
+        palaces = []
+        for palace_num in _LO_SHU_FLAT:
+            config = get_configuration(palace_num)
+            gate, star, spirit = config.gate, config.star, config.spirit
+            palaces.append((
+                palace_num,
+                gate.value if gate else None,
+                star.value if star else None,
+                spirit.value if spirit else None,
+                config.is_auspicious,
+            ))
+        
+        chart_key = (
+            chart.calculation_time.strftime('%Y-%m-%d %H:%M'),
+            chart.duty_chief_palace,
+            tuple(palaces),
+            chart.overall_pattern,
+            chart.favorable_str,
+            chart.strategic_assessment,
+        )
+        # show_stems_branches has never changed the output, so it stays out of the cache key
+        return _qimen_ascii_impl(chart_key)
     
     def render_qimen_detailed(self, chart: QiMenChart) -> str:
         """Render detailed Qi Men chart with full information"""
         
-        grid_layout = [
-            [4, 9, 2],
-            [3, 5, 7], 
-            [8, 1, 6]
-        ]
+        fav_str = chart.favorable_str
+        unfav_str = chart.unfavorable_str
         
-        result = []
-        result.append("┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓")
-        result.append("┃                           奇門遁甲 QI MEN DUN JIA CHART                              ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        result = list(_QIMEN_DETAILED_HEADER)
         result.append(f"┃ Time: {chart.calculation_time.strftime('%Y-%m-%d %H:%M')} | Lunar: {chart.lunar_date.year}/{chart.lunar_date.month}/{chart.lunar_date.day} | Duty Chief: Palace {chart.duty_chief_palace} ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        result.append(_HEAVY_RULE)
         
-        for row_idx, row in enumerate(grid_layout):
-            if row_idx > 0:
-                result.append("┃ ┠─────────────────────────┼─────────────────────────┼─────────────────────────┨ ┃")
-            else:
-                result.append("┃ ┌─────────────────────────┬─────────────────────────┬─────────────────────────┐ ┃")
+        get_configuration = chart.get_configuration
+        for idx, palace_num in enumerate(_LO_SHU_FLAT):
+            row_idx, col_idx = divmod(idx, 3)
+            if col_idx == 0:
+                result.append(_QIMEN_DETAILED_ROW_BORDERS[row_idx == 0])
+                
+                # Create 6 lines per palace for detailed info
+                palace_lines = line0, line1, line2, line3, line4, line5 = [], [], [], [], [], []
             
-            # Create 6 lines per palace for detailed info
-            palace_lines = [[] for _ in range(6)]
+            config = get_configuration(palace_num)
+            star_value = config.star.value
+            stem_chinese = config.heavenly_stem.chinese
+            branch_chinese = config.earthly_branch.chinese
+            gate, spirit = config.gate, config.spirit
             
-            for palace_num in row:
-                config = chart.configurations[palace_num]
-                
-                if palace_num == 5:
-                    # Center palace special formatting
-                    palace_lines[0].append(f" Palace 5 - CENTER 中宮  ")
-                    palace_lines[1].append(f" {config.star.value:<23}")
-                    palace_lines[2].append(f" Earth Element 土       ")
-                    palace_lines[3].append(f" Coordination Point     ")
-                    palace_lines[4].append(f" {config.heavenly_stem.chinese}{config.earthly_branch.chinese}                   ")
-                    palace_lines[5].append(" ─────────────────────── ")
-                else:
-                    # Regular palace
-                    auspicious = "吉 AUSPICIOUS" if config.is_auspicious else "凶 INAUSPICIOUS"
-                    palace_lines[0].append(f" Palace {palace_num} - {auspicious:<11}")
-                    palace_lines[1].append(f" 門 {config.gate.value:<19}")
-                    palace_lines[2].append(f" 星 {config.star.value:<19}")
-                    palace_lines[3].append(f" 神 {config.spirit.value:<19}")
-                    palace_lines[4].append(f" {config.heavenly_stem.chinese}{config.earthly_branch.chinese} {config.element.value}Element        ")
-                    palace_lines[5].append(f" {config.strategic_application[:23]}")
+            if gate is None or spirit is None:
+                # Center palace special formatting
+                line0.append(" Palace 5 - CENTER 中宮  ")
+                line1.append(f" {star_value:<23}")
+                line2.append(" Earth Element 土       ")
+                line3.append(" Coordination Point     ")
+                line4.append(f" {stem_chinese}{branch_chinese}                   ")
+                line5.append(" ─────────────────────── ")
+            else:
+                # Regular palace
+                auspicious = "吉 AUSPICIOUS" if config.is_auspicious else "凶 INAUSPICIOUS"
+                line0.append(f" Palace {palace_num} - {auspicious:<11}")
+                line1.append(f" 門 {gate.value:<19}")
+                line2.append(f" 星 {star_value:<19}")
+                line3.append(f" 神 {spirit.value:<19}")
+                line4.append(f" {stem_chinese}{branch_chinese} {config.element.value}Element        ")
+                line5.append(f" {config.strategic_application[:23]}")
             
-            for line_set in palace_lines:
-                line = "┃ │" + "│".join(line_set) + "│ ┃"
-                result.append(line)
-        
-        result.append("┃ └─────────────────────────┴─────────────────────────┴─────────────────────────┘ ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append(f"┃ OVERALL PATTERN: {chart.overall_pattern:<65} ┃")
-        result.append(f"┃ FAVORABLE DIRECTIONS: {', '.join([d.value for d in chart.favorable_directions]):<57} ┃")
-        result.append(f"┃ UNFAVORABLE DIRECTIONS: {', '.join([d.value for d in chart.unfavorable_directions]):<55} ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append(f"┃ STRATEGIC ASSESSMENT: {chart.strategic_assessment:<61} ┃")
-        result.append("┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛")
+            if col_idx == 2:
+                for line_set in palace_lines:
+                    line = "┃ │" + "│".join(line_set) + "│ ┃"
+                    result.append(line)
+        
+        result.append(_QIMEN_DETAILED_GRID_BOTTOM)
+        result.append(_HEAVY_RULE)
+        result.append(_boxed("┃ OVERALL PATTERN: ", chart.overall_pattern, 65, " ┃"))
+        result.append(_boxed("┃ FAVORABLE DIRECTIONS: ", fav_str, 57, " ┃"))
+        result.append(_boxed("┃ UNFAVORABLE DIRECTIONS: ", unfav_str, 55, " ┃"))
+        result.append(_HEAVY_RULE)
+        result.append(_boxed("┃ STRATEGIC ASSESSMENT: ", chart.strategic_assessment, 61, " ┃"))
+        result.append(_HEAVY_BOTTOM)
         
         return "\n".join(result)
     
@@ -156,11 +332,11 @@ class ChartVisualizer:
         """Render Taiyi chart in circular format showing palace positions and star movements"""
         
         result = []
-        result.append("╔═══════════════════════════════════════════════════════════════════╗")
+        result.append(_DOUBLE_TOP)
         result.append("║                     太乙神數 TAIYI DIVINE NUMBER                    ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         result.append(f"║ Query: {divination.query_date.strftime('%Y-%m-%d %H:%M')}   Lunar: {divination.lunar_date.year}/{divination.lunar_date.month}/{divination.lunar_date.day} ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         
         # Create circular arrangement of palaces
         # Traditional arrangement with 8 palaces around center (palace 5)
@@ -180,273 +356,203 @@ class ChartVisualizer:
         master_palace = divination.master_star_position.palace.number
         guest_palace = divination.guest_star_position.palace.number
         
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         result.append("║                          STAR POSITIONS                          ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         result.append(f"║ 主星 Master Star: {divination.master_star_position.star.value:<10} in Palace {master_palace} ║")
         result.append(f"║ 客星 Guest Star:  {divination.guest_star_position.star.value:<10} in Palace {guest_palace} ║")
         result.append(f"║ 積年 Accumulated Years: {divination.accumulated_years.total_years:<6} Palace: {divination.accumulated_years.palace_position} ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         
         # Show elemental influences
         result.append("║                       ELEMENTAL INFLUENCES                       ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         for element, influence in divination.elemental_influences.items():
             bar_length = int(influence * 20)  # Scale to 20 chars
-            bar = "█" * bar_length + "░" * (20 - bar_length)
+            bar = _BAR_LUT[max(0, min(20, bar_length))]
             result.append(f"║ {element.value} {bar} {influence:.2f} ║")
         
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         result.append("║                      STRATEGIC GUIDANCE                          ║")
-        result.append("╠═══════════════════════════════════════════════════════════════════╣")
+        result.append(_DOUBLE_RULE)
         
         # Split long guidance into multiple lines
         guidance_lines = self._wrap_text(divination.strategic_guidance, 60)
         for line in guidance_lines:
-            result.append(f"║ {line:<65} ║")
+            result.append(_boxed("║ ", line, 65))
         
-        result.append("╚═══════════════════════════════════════════════════════════════════╝")
+        result.append(_DOUBLE_BOTTOM)
         
         return "\n".join(result)
     
     def render_taiyi_detailed_circular(self, divination: TaiyiDivination) -> str:
         """Render detailed circular Taiyi chart with palace relationships"""
         
-        result = []
-        result.append("┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓")
-        result.append("┃                              太乙神數 TAIYI DIVINE NUMBER                              ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append(f"┃ Query Time: {divination.query_date.strftime('%B %d, %Y at %H:%M')} | Lunar: {divination.lunar_date.year}/{divination.lunar_date.month}/{divination.lunar_date.day} ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        buf = io.StringIO()
+        w = buf.write
+        w(_HEAVY_TOP_LINE)
+        w("┃                              太乙神數 TAIYI DIVINE NUMBER                              ┃\n")
+        w(_HEAVY_RULE_LINE)
+        w(f"┃ Query Time: {divination.query_date.strftime('%B %d, %Y at %H:%M')} | Lunar: {divination.lunar_date.year}/{divination.lunar_date.month}/{divination.lunar_date.day} ┃\n")
+        w(_HEAVY_RULE_LINE)
         
         # Detailed circular layout
-        result.append("┃                                                                                      ┃")
-        result.append("┃           6(乾宮) Northwest            1(坎宮) North            8(艮宮) Northeast      ┃")
-        result.append("┃              Heaven                      Water                    Mountain           ┃")
-        result.append("┃                 ╲                         │                         ╱               ┃")
-        result.append("┃                  ╲                        │                        ╱                ┃")
-        result.append("┃                   ╲                       │                       ╱                 ┃")
-        result.append("┃  7(兌宮) West ──────╲         5(中宮) CENTER         ╱────── 3(震宮) East           ┃")
-        result.append("┃     Lake             ╲          Earth           ╱              Thunder            ┃")
-        result.append("┃                       ╲                       ╱                                   ┃")
-        result.append("┃                        ╲                     ╱                                    ┃")
-        result.append("┃                         ╲                   ╱                                     ┃")
-        result.append("┃           2(坤宮) Southwest            9(離宮) South            4(巽宮) Southeast      ┃")
-        result.append("┃              Earth                      Fire                     Wind             ┃")
-        result.append("┃                                                                                      ┃")
+        w("┃                                                                                      ┃\n")
+        w("┃           6(乾宮) Northwest            1(坎宮) North            8(艮宮) Northeast      ┃\n")
+        w("┃              Heaven                      Water                    Mountain           ┃\n")
+        w("┃                 ╲                         │                         ╱               ┃\n")
+        w("┃                  ╲                        │                        ╱                ┃\n")
+        w("┃                   ╲                       │                       ╱                 ┃\n")
+        w("┃  7(兌宮) West ──────╲         5(中宮) CENTER         ╱────── 3(震宮) East           ┃\n")
+        w("┃     Lake             ╲          Earth           ╱              Thunder            ┃\n")
+        w("┃                       ╲                       ╱                                   ┃\n")
+        w("┃                        ╲                     ╱                                    ┃\n")
+        w("┃                         ╲                   ╱                                     ┃\n")
+        w("┃           2(坤宮) Southwest            9(離宮) South            4(巽宮) Southeast      ┃\n")
+        w("┃              Earth                      Fire                     Wind             ┃\n")
+        w("┃                                                                                      ┃\n")
         
         # Mark star positions on the diagram
         master_palace = divination.master_star_position.palace.number
         guest_palace = divination.guest_star_position.palace.number
         
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append("┃                                 STAR POSITIONS                                      ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        w(_HEAVY_RULE_LINE)
+        w("┃                                 STAR POSITIONS                                      ┃\n")
+        w(_HEAVY_RULE_LINE)
         
         # Master star details
         master_star = divination.master_star_position
-        result.append(f"┃ ⭐ MASTER STAR: {master_star.star.value} ({self.translator.TAIYI_STARS.get(master_star.star.value, 'Unknown')})")
-        result.append(f"┃    Location: Palace {master_palace} - {master_star.palace.chinese_name}")
-        result.append(f"┃    Influence: {master_star.influence_strength:.2f} | Quality: {master_star.palace.quality}")
-        result.append(f"┃    Strategy: {master_star.palace.strategic_use}")
-        result.append("┃")
+        w(f"┃ ⭐ MASTER STAR: {master_star.star.value} ({self.translator.TAIYI_STARS.get(master_star.star.value, 'Unknown')})\n")
+        w(f"┃    Location: Palace {master_palace} - {master_star.palace.chinese_name}\n")
+        w(f"┃    Influence: {master_star.influence_strength:.2f} | Quality: {master_star.palace.quality}\n")
+        w(f"┃    Strategy: {master_star.palace.strategic_use}\n")
+        w("┃\n")
         
         # Guest star details  
         guest_star = divination.guest_star_position
-        result.append(f"┃ 🌟 GUEST STAR: {guest_star.star.value} ({self.translator.TAIYI_STARS.get(guest_star.star.value, 'Unknown')})")
-        result.append(f"┃    Location: Palace {guest_palace} - {guest_star.palace.chinese_name}")
-        result.append(f"┃    Influence: {guest_star.influence_strength:.2f} | Quality: {guest_star.palace.quality}")
-        result.append(f"┃    Strategy: {guest_star.palace.strategic_use}")
+        w(f"┃ 🌟 GUEST STAR: {guest_star.star.value} ({self.translator.TAIYI_STARS.get(guest_star.star.value, 'Unknown')})\n")
+        w(f"┃    Location: Palace {guest_palace} - {guest_star.palace.chinese_name}\n")
+        w(f"┃    Influence: {guest_star.influence_strength:.2f} | Quality: {guest_star.palace.quality}\n")
+        w(f"┃    Strategy: {guest_star.palace.strategic_use}\n")
         
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append("┃                              PALACE RELATIONSHIPS                                   ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        w(_HEAVY_RULE_LINE)
+        w("┃                              PALACE RELATIONSHIPS                                   ┃\n")
+        w(_HEAVY_RULE_LINE)
         
         if divination.supporting_palaces:
-            result.append(f"┃ 🤝 SUPPORTING: {', '.join([p.chinese_name for p in divination.supporting_palaces])}")
+            w(f"┃ 🤝 SUPPORTING: {', '.join([p.chinese_name for p in divination.supporting_palaces])}\n")
         if divination.conflicting_palaces:
-            result.append(f"┃ ⚔️  CONFLICTING: {', '.join([p.chinese_name for p in divination.conflicting_palaces])}")
+            w(f"┃ ⚔️  CONFLICTING: {', '.join([p.chinese_name for p in divination.conflicting_palaces])}\n")
         
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
-        result.append("┃                                TIMING ANALYSIS                                      ┃")
-        result.append("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+        w(_HEAVY_RULE_LINE)
+        w("┃                                TIMING ANALYSIS                                      ┃\n")
+        w(_HEAVY_RULE_LINE)
         
         for period, analysis in divination.timing_analysis.items():
-            result.append(f"┃ {period}: {analysis}")
+            w(f"┃ {period}: {analysis}\n")
         
-        result.append("┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛")
+        w(_HEAVY_BOTTOM)
         
-        return "\n".join(result)
+        return buf.getvalue()
     
     def render_html_qimen(self, chart: QiMenChart) -> str:
         """Render Qi Men chart as HTML table"""
         
-        grid_layout = [
-            [4, 9, 2],
-            [3, 5, 7],
-            [8, 1, 6]
-        ]
+        fav_str = chart.favorable_str
+        unfav_str = chart.unfavorable_str
         
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Qi Men Dun Jia Chart - {chart.calculation_time.strftime('%Y-%m-%d %H:%M')}</title>
-    <style>
-        body {{ font-family: 'Microsoft YaHei', SimSun, serif; background-color: #f5f5dc; }}
-        .chart-container {{ max-width: 800px; margin: 20px auto; }}
-        .chart-title {{ text-align: center; font-size: 24px; font-weight: bold; color: #8B4513; margin-bottom: 20px; }}
-        .qimen-grid {{ display: grid; grid-template-columns: 1fr 1fr 1fr; grid-gap: 2px; background-color: #8B4513; border: 3px solid #8B4513; }}
-        .palace {{ background-color: white; padding: 15px; min-height: 120px; position: relative; }}
-        .palace.center {{ background-color: #fffacd; }}
-        .palace.auspicious {{ border-left: 5px solid #228B22; }}
-        .palace.inauspicious {{ border-left: 5px solid #DC143C; }}
-        .palace-number {{ font-weight: bold; font-size: 14px; color: #8B4513; }}
-        .gate {{ color: #DC143C; font-weight: bold; }}
-        .star {{ color: #4169E1; font-weight: bold; }}
-        .spirit {{ color: #9932CC; font-weight: bold; }}
-        .info-panel {{ margin-top: 20px; padding: 15px; background-color: white; border: 1px solid #8B4513; }}
-    </style>
-</head>
-<body>
-    <div class="chart-container">
-        <div class="chart-title">奇門遁甲 Qi Men Dun Jia Chart</div>
-        <div style="text-align: center; margin-bottom: 15px;">
-            Time: {chart.calculation_time.strftime('%Y-%m-%d %H:%M')} | 
-            Lunar: {chart.lunar_date.year}/{chart.lunar_date.month}/{chart.lunar_date.day} |
-            Duty Chief: Palace {chart.duty_chief_palace}
-        </div>
-        
-        <div class="qimen-grid">
-"""
+        fields = {
+            "time": chart.calculation_time.strftime('%Y-%m-%d %H:%M'),
+            "year": chart.lunar_date.year,
+            "month": chart.lunar_date.month,
+            "day": chart.lunar_date.day,
+            "duty_chief": chart.duty_chief_palace,
+        }
+        parts = [
+            _QIMEN_HTML_HEAD_TMPL.format_map(fields),
+            _QIMEN_HTML_STYLE,
+            _QIMEN_HTML_TITLE_TMPL.format_map(fields),
+        ]
         
-        for row in grid_layout:
-            for palace_num in row:
-                config = chart.configurations[palace_num]
-                
-                if palace_num == 5:
-                    # Center palace
-                    html += f"""
+        for palace_num in _LO_SHU_FLAT:
+            config = chart.get_configuration(palace_num)
+            gate, star, spirit = config.gate, config.star, config.spirit
+            
+            if palace_num == 5:
+                # Center palace
+                parts.append(f"""
             <div class="palace center">
                 <div class="palace-number">Palace {palace_num} 中宮</div>
                 <div class="star">⚬ CENTER ⚬</div>
-                <div class="star">{config.star.value if config.star else '天禽'}</div>
+                <div class="star">{star.value if star else '天禽'}</div>
                 <div style="margin-top: 10px; font-size: 12px;">Coordination Point</div>
             </div>
-"""
-                else:
-                    # Regular palace
-                    auspicious_class = "auspicious" if config.is_auspicious else "inauspicious"
-                    auspicious_text = "吉" if config.is_auspicious else "凶"
-                    
-                    html += f"""
+""")
+            else:
+                # Regular palace
+                is_auspicious = config.is_auspicious
+                auspicious_class = "auspicious" if is_auspicious else "inauspicious"
+                auspicious_text = "吉" if is_auspicious else "凶"
+                stem, branch = config.heavenly_stem, config.earthly_branch
+                
+                parts.append(f"""
             <div class="palace {auspicious_class}">
                 <div class="palace-number">Palace {palace_num} {auspicious_text}</div>
-                <div class="gate">門: {config.gate.value if config.gate else '──'}</div>
-                <div class="star">星: {config.star.value if config.star else '──'}</div>
-                <div class="spirit">神: {config.spirit.value if config.spirit else '──'}</div>
-                <div style="margin-top: 5px; font-size: 11px;">{config.heavenly_stem.chinese if config.heavenly_stem else ''}
-                {config.earthly_branch.chinese if config.earthly_branch else ''}</div>
+                <div class="gate">門: {gate.value if gate else '──'}</div>
+                <div class="star">星: {star.value if star else '──'}</div>
+                <div class="spirit">神: {spirit.value if spirit else '──'}</div>
+                <div style="margin-top: 5px; font-size: 11px;">{stem.chinese if stem else ''}
+                {branch.chinese if branch else ''}</div>
             </div>
-"""
-        
-        html += f"""
+""")
+    
+        parts.append(f"""
         </div>
         
         <div class="info-panel">
             <h3>Chart Analysis</h3>
             <p><strong>Overall Pattern:</strong> {chart.overall_pattern}</p>
-            <p><strong>Favorable Directions:</strong> {', '.join([d.value for d in chart.favorable_directions])}</p>
-            <p><strong>Unfavorable Directions:</strong> {', '.join([d.value for d in chart.unfavorable_directions])}</p>
+            <p><strong>Favorable Directions:</strong> {fav_str}</p>
+            <p><strong>Unfavorable Directions:</strong> {unfav_str}</p>
             <p><strong>Strategic Assessment:</strong> {chart.strategic_assessment}</p>
             <p><strong>Optimal Timing:</strong> {chart.optimal_timing}</p>
         </div>
     </div>
 </body>
 </html>
-"""
-        return html
+""")
+        return "".join(parts)
     
     def render_html_taiyi(self, divination: TaiyiDivination) -> str:
         """Render Taiyi chart as HTML with circular layout"""
         
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Taiyi Divine Number - {divination.query_date.strftime('%Y-%m-%d %H:%M')}</title>
-    <style>
-        body {{ font-family: 'Microsoft YaHei', SimSun, serif; background-color: #1a1a2e; color: #eee; }}
-        .chart-container {{ max-width: 900px; margin: 20px auto; }}
-        .chart-title {{ text-align: center; font-size: 28px; font-weight: bold; color: #ffd700; margin-bottom: 20px; }}
-        .circular-chart {{ position: relative; width: 500px; height: 500px; margin: 0 auto; }}
-        .palace {{ position: absolute; width: 80px; height: 80px; border: 2px solid #ffd700; border-radius: 50%; 
-                   background-color: #16213e; display: flex; flex-direction: column; align-items: center; 
-                   justify-content: center; font-size: 12px; text-align: center; }}
-        .palace.master-star {{ background-color: #ff6b6b; border-color: #ff6b6b; color: white; }}
-        .palace.guest-star {{ background-color: #4ecdc4; border-color: #4ecdc4; color: white; }}
-        .palace.center {{ width: 100px; height: 100px; background-color: #ffd700; color: #1a1a2e; font-weight: bold; }}
-        .star-info {{ margin: 20px 0; padding: 20px; background-color: #16213e; border-radius: 10px; }}
-        .element-bar {{ display: flex; align-items: center; margin: 5px 0; }}
-        .element-name {{ width: 60px; }}
-        .bar {{ height: 20px; background-color: #333; border-radius: 10px; flex-grow: 1; margin: 0 10px; position: relative; }}
-        .bar-fill {{ height: 100%; border-radius: 10px; }}
-        .wood {{ background-color: #228B22; }}
-        .fire {{ background-color: #DC143C; }}
-        .earth {{ background-color: #DAA520; }}
-        .metal {{ background-color: #C0C0C0; }}
-        .water {{ background-color: #4169E1; }}
-    </style>
-</head>
-<body>
-    <div class="chart-container">
-        <div class="chart-title">太乙神數 Taiyi Divine Number</div>
-        <div style="text-align: center; margin-bottom: 30px; font-size: 16px;">
-            Query: {divination.query_date.strftime('%B %d, %Y at %H:%M')} | 
-            Lunar: {divination.lunar_date.year}/{divination.lunar_date.month}/{divination.lunar_date.day} |
-            Accumulated Years: {divination.accumulated_years.total_years}
-        </div>
-        
-        <div class="circular-chart">
-            <!-- Center Palace -->
-            <div class="palace center" style="top: 210px; left: 210px;">
-                <div>中宮</div>
-                <div>CENTER</div>
-            </div>
-"""
-        
-        # Palace positions in circular arrangement
-        palace_positions = {
-            1: {"top": "50px", "left": "210px", "name": "坎宮<br>North"},     # North
-            2: {"top": "350px", "left": "110px", "name": "坤宮<br>SW"},      # Southwest  
-            3: {"top": "210px", "left": "350px", "name": "震宮<br>East"},    # East
-            4: {"top": "350px", "left": "310px", "name": "巽宮<br>SE"},      # Southeast
-            6: {"top": "50px", "left": "110px", "name": "乾宮<br>NW"},       # Northwest
-            7: {"top": "210px", "left": "50px", "name": "兌宮<br>West"},     # West
-            8: {"top": "50px", "left": "310px", "name": "艮宮<br>NE"},       # Northeast
-            9: {"top": "350px", "left": "210px", "name": "離宮<br>South"}    # South
+        fields = {
+            "time": divination.query_date.strftime('%Y-%m-%d %H:%M'),
+            "query": divination.query_date.strftime('%B %d, %Y at %H:%M'),
+            "year": divination.lunar_date.year,
+            "month": divination.lunar_date.month,
+            "day": divination.lunar_date.day,
+            "accumulated_years": divination.accumulated_years.total_years,
         }
+        parts = [
+            _TAIYI_HTML_HEAD_TMPL.format_map(fields),
+            _TAIYI_HTML_STYLE,
+            _TAIYI_HTML_TITLE_TMPL.format_map(fields),
+        ]
         
         master_palace = divination.master_star_position.palace.number
         guest_palace = divination.guest_star_position.palace.number
         
-        for palace_num, pos in palace_positions.items():
-            star_class = ""
+        for palace_num, tmpl in _TAIYI_PALACE_DIVS.items():
             if palace_num == master_palace:
                 star_class = "master-star"
             elif palace_num == guest_palace:
                 star_class = "guest-star"
-                
-            html += f"""
-            <div class="palace {star_class}" style="top: {pos['top']}; left: {pos['left']};">
-                <div>{palace_num}</div>
-                <div>{pos['name']}</div>
-            </div>
-"""
+            else:
+                star_class = ""
+            parts.append(tmpl.format(star_class=star_class))
         
-        html += f"""
+        parts.append(f"""
         </div>
         
         <div class="star-info">
@@ -465,7 +571,7 @@ class ChartVisualizer:
         
         <div class="star-info">
             <h3>🌟 Elemental Influences</h3>
-"""
+""")
         
         element_colors = {
             "木": "wood", "火": "fire", "土": "earth", "金": "metal", "水": "water"
@@ -475,7 +581,7 @@ class ChartVisualizer:
             color_class = element_colors.get(element.value, "")
             percentage = influence * 100
             
-            html += f"""
+            parts.append(f"""
             <div class="element-bar">
                 <div class="element-name">{element.value}</div>
                 <div class="bar">
@@ -483,9 +589,9 @@ class ChartVisualizer:
                 </div>
                 <div>{influence:.2f}</div>
             </div>
-"""
+""")
         
-        html += f"""
+        parts.append(f"""
         </div>
         
         <div class="star-info">
@@ -495,209 +601,254 @@ class ChartVisualizer:
         
         <div class="star-info">
             <h3>⏰ Timing Analysis</h3>
-"""
+""")
         
         for period, analysis in divination.timing_analysis.items():
-            html += f"<p><strong>{period}:</strong> {analysis}</p>"
+            parts.append(f"<p><strong>{period}:</strong> {analysis}</p>")
         
-        html += """
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        parts.append(_TAIYI_HTML_TAIL)
+        return "".join(parts)
     
     def _wrap_text(self, text: str, width: int) -> List[str]:
         """Helper function to wrap text to specified width"""
-        words = text.split()
         lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line + " " + word) <= width:
-                if current_line:
-                    current_line += " " + word
-                else:
-                    current_line = word
+        line_words: List[str] = []
+        line_length = 0
+        
+        for word in text.split():
+            if line_length + 1 + len(word) <= width:
+                line_length = line_length + 1 + len(word) if line_words else len(word)
+                line_words.append(word)
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                if line_words:
+                    lines.append(" ".join(line_words))
+                line_words = [word]
+                line_length = len(word)
         
-        if current_line:
-            lines.append(current_line)
+        if line_words:
+            lines.append(" ".join(line_words))
         
         return lines
 
 
 # Matplotlib support (optional)
-def create_matplotlib_qimen(chart: QiMenChart, save_path: Optional[str] = None):
-    """Create Qi Men chart using matplotlib (requires matplotlib)"""
-    try:
-        import matplotlib.pyplot as plt
+_MPL_OK = find_spec("matplotlib") is not None
+_CHINESE_FONT_PATH = 'C:/Windows/Fonts/msyh.ttc'  # Microsoft YaHei
+_MPL = None
+_CHINESE_FONT = None
+
+# Qi Men palace labels for the matplotlib chart
+_MPL_QIMEN_PALACE_TMPL = "Palace {palace_num} {aus}\n門: {gate}\n星: {star}\n神: {spirit}"
+_MPL_QIMEN_CENTER_TMPL = "Palace {palace_num}\n中宮\n{star}"
+
+# Qi Men palace fills, indexed by is_auspicious
+_MPL_QIMEN_FILLS = ('lightcoral', 'lightgreen')
+_MPL_QIMEN_CENTER_FILL = 'lightyellow'
+
+# Qi Men palace cells as (number, x, y), with the y-axis flipped for display
+_MPL_QIMEN_CELLS = tuple(
+    (palace_num, col_idx, 2 - row_idx)
+    for row_idx, row in enumerate(_LO_SHU_LAYOUT)
+    for col_idx, palace_num in enumerate(row)
+)
+
+# Taiyi palaces in circle as (number, x, y, name)
+_MPL_TAIYI_CENTER = (0, 0)
+_MPL_TAIYI_PALACES = (
+    (1, 0, 4, "坎宮\nNorth"),      # North
+    (2, -3, -3, "坤宮\nSW"),       # Southwest
+    (3, 4, 0, "震宮\nEast"),       # East
+    (4, 3, -3, "巽宮\nSE"),        # Southeast
+    (5, 0, 0, "中宮\nCenter"),     # Center
+    (6, -3, 3, "乾宮\nNW"),        # Northwest
+    (7, -4, 0, "兌宮\nWest"),      # West
+    (8, 3, 3, "艮宮\nNE"),         # Northeast
+    (9, 0, -4, "離宮\nSouth"),     # South
+)
+
+
+def _get_mpl():
+    """Import matplotlib once per process"""
+    global _MPL
+    if _MPL is None:
         import matplotlib.patches as patches
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection, PatchCollection
+        from matplotlib.figure import Figure
+        _MPL = (Figure, FigureCanvasAgg, patches, PatchCollection, LineCollection)
+    return _MPL
+
+
+def _new_chart_figure():
+    """Create a 12x12 inch figure on an Agg canvas, bypassing pyplot (requires matplotlib)"""
+    Figure, FigureCanvasAgg = _get_mpl()[:2]
+    
+    # These charts are only ever saved to files, so no GUI backend or
+    # pyplot figure manager is needed
+    fig = Figure(figsize=(12, 12))
+    FigureCanvasAgg(fig)
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.9, bottom=0.02)
+    return fig, fig.add_subplot(1, 1, 1)
+
+
+def _get_chinese_font():
+    """Resolve the Chinese font once per process (requires matplotlib)"""
+    global _CHINESE_FONT
+    if _CHINESE_FONT is None:
         from matplotlib.font_manager import FontProperties
         
         # Try to use a Chinese font
-        try:
-            chinese_font = FontProperties(fname='C:/Windows/Fonts/msyh.ttc')  # Microsoft YaHei
-        except:
-            chinese_font = FontProperties()
-        
-        fig, ax = plt.subplots(1, 1, figsize=(12, 12))
-        ax.set_xlim(0, 3)
-        ax.set_ylim(0, 3)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Grid layout
-        grid_layout = [
-            [4, 9, 2],
-            [3, 5, 7],
-            [8, 1, 6]
-        ]
-        
-        # Draw grid
-        for i in range(4):
-            ax.axhline(y=i, color='brown', linewidth=2)
-            ax.axvline(x=i, color='brown', linewidth=2)
-        
-        # Fill palaces
-        for row_idx, row in enumerate(grid_layout):
-            for col_idx, palace_num in enumerate(row):
-                config = chart.configurations[palace_num]
-                
-                x, y = col_idx, 2 - row_idx  # Flip y-axis for display
-                
-                # Color based on auspiciousness
-                if palace_num == 5:
-                    color = 'lightyellow'
-                elif config.is_auspicious:
-                    color = 'lightgreen'
-                else:
-                    color = 'lightcoral'
-                
-                rect = patches.Rectangle((x, y), 1, 1, linewidth=2, 
-                                       edgecolor='brown', facecolor=color, alpha=0.7)
-                ax.add_patch(rect)
-                
-                # Add text
-                if palace_num == 5:
-                    ax.text(x + 0.5, y + 0.5, f'Palace {palace_num}\n中宮\n{config.star.value if config.star else ""}', 
-                           ha='center', va='center', fontproperties=chinese_font, fontsize=10)
-                else:
-                    auspicious = "吉" if config.is_auspicious else "凶"
-                    text = f'Palace {palace_num} {auspicious}\n'
-                    text += f'門: {config.gate.value[:2] if config.gate else "──"}\n'
-                    text += f'星: {config.star.value[:2] if config.star else "──"}\n'
-                    text += f'神: {config.spirit.value[:2] if config.spirit else "──"}'
-                    
-                    ax.text(x + 0.5, y + 0.5, text, ha='center', va='center', 
-                           fontproperties=chinese_font, fontsize=8)
-        
-        plt.title(f'奇門遁甲 Qi Men Dun Jia Chart\n{chart.calculation_time.strftime("%Y-%m-%d %H:%M")}', 
-                 fontproperties=chinese_font, fontsize=16, pad=20)
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        return fig
-    
-    except ImportError:
+        if os.path.isfile(_CHINESE_FONT_PATH):
+            _CHINESE_FONT = FontProperties(fname=_CHINESE_FONT_PATH)
+        else:
+            _CHINESE_FONT = FontProperties()
+    return _CHINESE_FONT
+
+
+def _save_png(fig, save_path: str, dpi: int):
+    """Render a figure with Agg and write it as a PNG (Agg encodes with Pillow)"""
+    # savefig applies the dpi only for this render, leaving the figure unchanged
+    fig.savefig(save_path, dpi=dpi, format="png", pil_kwargs={"optimize": False})
+
+
+def create_matplotlib_qimen(chart: QiMenChart, save_path: Optional[str] = None, ax=None,
+                            return_fig: bool = True):
+    """Create Qi Men chart using matplotlib, optionally redrawing an existing axes (requires matplotlib)"""
+    if not _MPL_OK:
         print("Matplotlib not available. Install with: pip install matplotlib")
         return None
+    
+    _, _, patches, PatchCollection, _ = _get_mpl()
+    chinese_font = _get_chinese_font()
+    
+    if ax is None:
+        fig, ax = _new_chart_figure()
+    else:
+        # Reuse the axes and its figure, e.g. from a previous chart render
+        ax.clear()
+        fig = ax.figure
+    ax.set_xlim(0, 3)
+    ax.set_ylim(0, 3)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    # Draw grid
+    for i in range(4):
+        ax.axhline(y=i, color='brown', linewidth=2)
+        ax.axvline(x=i, color='brown', linewidth=2)
+    
+    # Fill palaces
+    text_kwargs = dict(ha='center', va='center', fontproperties=chinese_font)
+    rects = []
+    colors = []
+    get_configuration = chart.get_configuration
+    for palace_num, x, y in _MPL_QIMEN_CELLS:
+        config = get_configuration(palace_num)
+        
+        # Color based on auspiciousness
+        colors.append(_MPL_QIMEN_CENTER_FILL if palace_num == 5 else _MPL_QIMEN_FILLS[config.is_auspicious])
+        rects.append(patches.Rectangle((x, y), 1, 1))
+        
+        # Add text
+        gate, star, spirit = config.gate, config.star, config.spirit
+        if palace_num == 5:
+            text = _MPL_QIMEN_CENTER_TMPL.format(
+                palace_num=palace_num, star=star.value if star else "")
+            ax.text(x + 0.5, y + 0.5, text, fontsize=10, **text_kwargs)
+        else:
+            text = _MPL_QIMEN_PALACE_TMPL.format(
+                palace_num=palace_num,
+                aus="吉" if config.is_auspicious else "凶",
+                gate=gate.value[:2] if gate else "──",
+                star=star.value[:2] if star else "──",
+                spirit=spirit.value[:2] if spirit else "──",
+            )
+            ax.text(x + 0.5, y + 0.5, text, fontsize=8, **text_kwargs)
+    
+    ax.add_collection(PatchCollection(rects, facecolors=colors, edgecolors='brown', linewidths=2,
+                                      alpha=0.7, rasterized=True))
+    
+    ax.set_title(f'奇門遁甲 Qi Men Dun Jia Chart\n{chart.calculation_time.strftime("%Y-%m-%d %H:%M")}', 
+                 fontproperties=chinese_font, fontsize=16, pad=20)
+    
+    if save_path:
+        _save_png(fig, save_path, dpi=150)
+        if not return_fig:
+            # Release the artists and the Agg buffer once the file is written
+            fig.clear()
+            return None
+    
+    return fig
 
 
-def create_matplotlib_taiyi(divination: TaiyiDivination, save_path: Optional[str] = None):
+def create_matplotlib_taiyi(divination: TaiyiDivination, save_path: Optional[str] = None,
+                            return_fig: bool = True):
     """Create Taiyi circular chart using matplotlib (requires matplotlib)"""
-    try:
-        import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        from matplotlib.font_manager import FontProperties
-        import numpy as np
-        
-        # Try to use a Chinese font
-        try:
-            chinese_font = FontProperties(fname='C:/Windows/Fonts/msyh.ttc')  # Microsoft YaHei
-        except:
-            chinese_font = FontProperties()
-        
-        fig, ax = plt.subplots(1, 1, figsize=(12, 12))
-        ax.set_xlim(-6, 6)
-        ax.set_ylim(-6, 6)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Palace positions in circle
-        palace_positions = {
-            1: (0, 4),      # North
-            2: (-3, -3),    # Southwest
-            3: (4, 0),      # East
-            4: (3, -3),     # Southeast
-            5: (0, 0),      # Center
-            6: (-3, 3),     # Northwest
-            7: (-4, 0),     # West
-            8: (3, 3),      # Northeast
-            9: (0, -4)      # South
-        }
-        
-        palace_names = {
-            1: "坎宮\nNorth", 2: "坤宮\nSW", 3: "震宮\nEast", 4: "巽宮\nSE",
-            5: "中宮\nCenter", 6: "乾宮\nNW", 7: "兌宮\nWest", 8: "艮宮\nNE", 9: "離宮\nSouth"
-        }
-        
-        master_palace = divination.master_star_position.palace.number
-        guest_palace = divination.guest_star_position.palace.number
-        
-        # Draw palaces
-        for palace_num, (x, y) in palace_positions.items():
-            if palace_num == 5:
-                # Center palace
-                circle = patches.Circle((x, y), 0.8, color='gold', alpha=0.8)
-                ax.add_patch(circle)
-                ax.text(x, y, palace_names[palace_num], ha='center', va='center', 
-                       fontproperties=chinese_font, fontsize=12, weight='bold')
-            else:
-                # Outer palaces
-                if palace_num == master_palace:
-                    color = 'red'
-                    alpha = 0.9
-                elif palace_num == guest_palace:
-                    color = 'blue'
-                    alpha = 0.9
-                else:
-                    color = 'lightblue'
-                    alpha = 0.6
-                
-                circle = patches.Circle((x, y), 0.6, color=color, alpha=alpha)
-                ax.add_patch(circle)
-                ax.text(x, y, f'{palace_num}\n{palace_names[palace_num]}', ha='center', va='center', 
-                       fontproperties=chinese_font, fontsize=10)
-        
-        # Draw connections
-        center = palace_positions[5]
-        for palace_num, (x, y) in palace_positions.items():
-            if palace_num != 5:
-                ax.plot([center[0], x], [center[1], y], 'k-', alpha=0.3, linewidth=1)
-        
-        # Add star information
-        title_text = f'太乙神數 Taiyi Divine Number\n{divination.query_date.strftime("%Y-%m-%d %H:%M")}'
-        plt.title(title_text, fontproperties=chinese_font, fontsize=16, pad=20)
-        
-        # Add legend
-        legend_text = f'⭐ Master Star: {divination.master_star_position.star.value} (Palace {master_palace})\n'
-        legend_text += f'🌟 Guest Star: {divination.guest_star_position.star.value} (Palace {guest_palace})\n'
-        legend_text += f'積年: {divination.accumulated_years.total_years} years'
-        
-        ax.text(-5.5, 5.5, legend_text, fontproperties=chinese_font, fontsize=10, 
-               bbox=dict(boxstyle="round,pad=0.3", facecolor="wheat", alpha=0.8))
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        
-        return fig
-    
-    except ImportError:
+    if not _MPL_OK:
         print("Matplotlib not available. Install with: pip install matplotlib")
-        return None
\ No newline at end of file
+        return None
+    
+    _, _, patches, PatchCollection, LineCollection = _get_mpl()
+    from matplotlib.colors import to_rgba
+    chinese_font = _get_chinese_font()
+    
+    fig, ax = _new_chart_figure()
+    ax.set_xlim(-6, 6)
+    ax.set_ylim(-6, 6)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    
+    master_palace = divination.master_star_position.palace.number
+    guest_palace = divination.guest_star_position.palace.number
+    
+    # Palace fills; later assignments win, so the master star beats the
+    # guest star and the center palace is always gold
+    palace_fills = dict.fromkeys(range(1, 10), ('lightblue', 0.6))
+    palace_fills[guest_palace] = ('blue', 0.9)
+    palace_fills[master_palace] = ('red', 0.9)
+    palace_fills[5] = ('gold', 0.8)
+    fills = [to_rgba(*palace_fills[palace_num]) for palace_num, _, _, _ in _MPL_TAIYI_PALACES]
+    
+    # Draw palaces
+    text_kwargs = dict(ha='center', va='center', fontproperties=chinese_font)
+    circles = []
+    for palace_num, x, y, name in _MPL_TAIYI_PALACES:
+        if palace_num == 5:
+            # Center palace
+            circles.append(patches.Circle((x, y), 0.8))
+            ax.text(x, y, name, fontsize=12, weight='bold', **text_kwargs)
+        else:
+            # Outer palaces
+            circles.append(patches.Circle((x, y), 0.6))
+            ax.text(x, y, f'{palace_num}\n{name}', fontsize=10, **text_kwargs)
+    
+    ax.add_collection(PatchCollection(circles, facecolors=fills, edgecolors=fills, rasterized=True))
+    
+    # Draw connections
+    segments = [
+        (_MPL_TAIYI_CENTER, (x, y))
+        for palace_num, x, y, _ in _MPL_TAIYI_PALACES
+        if palace_num != 5
+    ]
+    ax.add_collection(LineCollection(segments, colors='k', alpha=0.3, linewidths=1))
+    
+    # Add star information
+    title_text = f'太乙神數 Taiyi Divine Number\n{divination.query_date.strftime("%Y-%m-%d %H:%M")}'
+    ax.set_title(title_text, fontproperties=chinese_font, fontsize=16, pad=20)
+    
+    # Add legend
+    legend_text = f'⭐ Master Star: {divination.master_star_position.star.value} (Palace {master_palace})\n'
+    legend_text += f'🌟 Guest Star: {divination.guest_star_position.star.value} (Palace {guest_palace})\n'
+    legend_text += f'積年: {divination.accumulated_years.total_years} years'
+    
+    ax.text(-5.5, 5.5, legend_text, fontproperties=chinese_font, fontsize=10, 
+           bbox=dict(boxstyle="round,pad=0.3", facecolor="wheat", alpha=0.8))
+    
+    if save_path:
+        _save_png(fig, save_path, dpi=150)
+        if not return_fig:
+            # Release the artists and the Agg buffer once the file is written
+            fig.clear()
+            return None
+    
+    return fig
\ No newline at end of file
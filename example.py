@@ -1,10 +1,55 @@
 import datetime
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib.util import find_spec
 
 from divination.taiyi import TaiyiCalculator
 from divination.qi_men_dunjia import QiMenCalculator, TimeFrame
 from divination.visualizations import ChartVisualizer, create_matplotlib_qimen, create_matplotlib_taiyi
 
+MATPLOTLIB_AVAILABLE = find_spec("matplotlib") is not None
+
+
+def save_qimen_pngs(jobs):
+    """Render Qi Men charts to PNG in a worker process, reusing one figure"""
+    ax = None
+    last_index = len(jobs) - 1
+    for index, (chart, save_path) in enumerate(jobs):
+        # Keep the figure for the next chart, and release it after the last one
+        fig = create_matplotlib_qimen(chart, save_path, ax=ax, return_fig=index < last_index)
+        if fig is not None:
+            ax = fig.axes[0]
+    return [save_path for _, save_path in jobs]
+
+
+def print_qimen_charts(calculator, visualizer, hour_chart, day_chart, month_chart):
+    """Print the text views of the hour, day and month Qi Men charts and save the hour chart as HTML"""
+    # Hour-based chart (most common)
+    print("\n⏰ HOURLY CHART:")
+    
+    print("\n📊 STANDARD DISPLAY:")
+    print(calculator.display_qi_men_chart(hour_chart))
+    
+    print("\n🎨 ASCII ART CHART:")
+    print(visualizer.render_qimen_ascii(hour_chart))
+    
+    print("\n📋 DETAILED ASCII CHART:")
+    print(visualizer.render_qimen_detailed(hour_chart))
+    
+    # Save HTML version
+    html_content = visualizer.render_html_qimen(hour_chart)
+    with open("output/qimen_hour_chart.html", "wb") as f:
+        f.write(html_content.encode("utf-8"))
+    print("💾 HTML hour chart saved to: output/qimen_hour_chart.html")
+    
+    # Day-based chart
+    print("\n📅 DAILY CHART:")
+    print(visualizer.render_qimen_ascii(day_chart))
+    
+    # Month-based chart
+    print("\n🗓️  MONTHLY CHART:")
+    print(visualizer.render_qimen_ascii(month_chart))
+
 
 def demonstrate_taiyi_divination():
     """Demonstrate Taiyi Divine Number system with multiple visualization options"""
@@ -37,8 +82,8 @@ def demonstrate_taiyi_divination():
     # Save HTML version
     html_content = visualizer.render_html_taiyi(divination)
     os.makedirs("output", exist_ok=True)
-    with open("output/taiyi_chart.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+    with open("output/taiyi_chart.html", "wb") as f:
+        f.write(html_content.encode("utf-8"))
     print("💾 HTML chart saved to: output/taiyi_chart.html")
     
     # Try matplotlib version (optional)
@@ -66,42 +111,37 @@ def demonstrate_qimen_charts():
     current_time = datetime.datetime.now()
     print(f"Calculating for: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Hour-based chart (most common)
-    print("\n⏰ HOURLY CHART:")
     hour_chart = calculator.calculate_qi_men_chart(current_time, TimeFrame.HOUR)
-    
-    print("\n📊 STANDARD DISPLAY:")
-    print(calculator.display_qi_men_chart(hour_chart))
-    
-    print("\n🎨 ASCII ART CHART:")
-    print(visualizer.render_qimen_ascii(hour_chart))
-    
-    print("\n📋 DETAILED ASCII CHART:")
-    print(visualizer.render_qimen_detailed(hour_chart))
-    
-    # Save HTML version
-    html_content = visualizer.render_html_qimen(hour_chart)
-    with open("output/qimen_hour_chart.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    print("💾 HTML hour chart saved to: output/qimen_hour_chart.html")
-    
-    # Day-based chart
-    print("\n📅 DAILY CHART:")
     day_chart = calculator.calculate_qi_men_chart(current_time, TimeFrame.DAY)
-    print(visualizer.render_qimen_ascii(day_chart))
-    
-    # Month-based chart
-    print("\n🗓️  MONTHLY CHART:")
     month_chart = calculator.calculate_qi_men_chart(current_time, TimeFrame.MONTH)
-    print(visualizer.render_qimen_ascii(month_chart))
     
-    # Try matplotlib version (optional)
-    try:
-        fig = create_matplotlib_qimen(hour_chart, "output/qimen_chart.png")
-        if fig:
-            print("🖼️  Matplotlib chart saved to: output/qimen_chart.png")
-    except Exception as e:
-        print(f"📝 Matplotlib visualization not available: {e}")
+    if not MATPLOTLIB_AVAILABLE:
+        print("📝 Matplotlib visualization not available. Install with: pip install matplotlib")
+        print_qimen_charts(calculator, visualizer, hour_chart, day_chart, month_chart)
+        return hour_chart
+    
+    # Render the matplotlib versions (optional) in parallel worker processes
+    # while the text charts are printed. Each worker gets a batch of charts and
+    # reuses one figure across its batch, so with fewer cores than charts the
+    # figure setup is still paid once per worker
+    png_jobs = [
+        (hour_chart, "output/qimen_chart.png"),
+        (day_chart, "output/qimen_day_chart.png"),
+        (month_chart, "output/qimen_month_chart.png"),
+    ]
+    workers = min(len(png_jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(save_qimen_pngs, png_jobs[i::workers]) for i in range(workers)]
+        
+        print_qimen_charts(calculator, visualizer, hour_chart, day_chart, month_chart)
+        
+        # Collect the matplotlib versions
+        for future in as_completed(futures):
+            try:
+                for saved_path in future.result():
+                    print(f"🖼️  Matplotlib chart saved to: {saved_path}")
+            except Exception as e:
+                print(f"📝 Matplotlib visualization not available: {e}")
     
     return hour_chart
 
@@ -0,0 +1,62 @@
+import copy
+import pickle
+import unittest
+from datetime import datetime
+
+from divination.taiyi import TaiyiCalculator
+from divination.trigrams import get_eight_trigrams, get_nine_palaces
+
+
+class PalacePickleTest(unittest.TestCase):
+    """Palaces expose read-only mappings but must still pickle and copy"""
+
+    def assert_same_palace(self, palace, restored):
+        self.assertEqual(restored.number, palace.number)
+        self.assertEqual(restored.chinese_name, palace.chinese_name)
+        self.assertEqual(dict(restored.palace_attributes), dict(palace.palace_attributes))
+        self.assertEqual(dict(restored.energy_characteristics), dict(palace.energy_characteristics))
+        self.assertEqual(restored.get_opposing_palace().number, palace.get_opposing_palace().number)
+        with self.assertRaises(TypeError):
+            restored.palace_attributes["cosmic_function"] = "changed"
+
+    def test_pickle_round_trip(self):
+        for palace in get_nine_palaces().palaces:
+            self.assert_same_palace(palace, pickle.loads(pickle.dumps(palace)))
+
+    def test_deepcopy(self):
+        for palace in get_nine_palaces().palaces:
+            self.assert_same_palace(palace, copy.deepcopy(palace))
+
+    def test_trigram_pickle_round_trip(self):
+        for trigram in get_eight_trigrams().trigrams:
+            restored = pickle.loads(pickle.dumps(trigram))
+            self.assertEqual(restored.lines, trigram.lines)
+            self.assertEqual(restored.get_visual_symbol(), trigram.get_visual_symbol())
+            self.assertEqual(restored.cultivation_practices, trigram.cultivation_practices)
+
+
+class TaiyiDivinationPickleTest(unittest.TestCase):
+    """Cached divinations are shared read-only but must still pickle and copy"""
+
+    def setUp(self):
+        self.divination = TaiyiCalculator().perform_divination(datetime(2024, 3, 5, 10, 30))
+
+    def assert_same_divination(self, restored):
+        divination = self.divination
+        self.assertEqual(restored.query_date, divination.query_date)
+        self.assertEqual(restored.overall_assessment, divination.overall_assessment)
+        self.assertEqual(restored.active_palace.number, divination.active_palace.number)
+        self.assertEqual(dict(restored.timing_analysis), dict(divination.timing_analysis))
+        self.assertEqual(dict(restored.elemental_influences), dict(divination.elemental_influences))
+        with self.assertRaises(TypeError):
+            restored.timing_analysis["Today"] = "changed"
+
+    def test_pickle_round_trip(self):
+        self.assert_same_divination(pickle.loads(pickle.dumps(self.divination)))
+
+    def test_deepcopy(self):
+        self.assert_same_divination(copy.deepcopy(self.divination))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from datetime import datetime
+
+from divination.qi_men_dunjia import QiMenCalculator
+
+
+class QiMenChartsBatchTest(unittest.TestCase):
+    """Batch calculation matches single charts and shares charts for repeated timestamps"""
+
+    def setUp(self):
+        self.calculator = QiMenCalculator()
+        self.first = datetime(2024, 3, 5, 10, 30)
+        self.second = datetime(2024, 3, 5, 13, 30)
+
+    def test_repeated_timestamps_share_one_chart(self):
+        charts = self.calculator.calculate_qi_men_charts_batch([self.first, self.first, self.second])
+        self.assertEqual(len(charts), 3)
+        self.assertIs(charts[0], charts[1])
+        self.assertIsNot(charts[0], charts[2])
+
+    def test_matches_single_chart(self):
+        batch_chart, = self.calculator.calculate_qi_men_charts_batch(iter([self.second]))
+        chart = self.calculator.calculate_qi_men_chart(self.second)
+        self.assertEqual(batch_chart.calculation_time, chart.calculation_time)
+        self.assertEqual(batch_chart.duty_chief_palace, chart.duty_chief_palace)
+        self.assertEqual(batch_chart.overall_pattern, chart.overall_pattern)
+
+    def test_empty_input(self):
+        self.assertEqual(self.calculator.calculate_qi_men_charts_batch([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from datetime import datetime, timedelta
+
+from divination.taiyi import TaiyiCalculator
+
+
+class DivinationRangeTest(unittest.TestCase):
+    """perform_divination_range steps from start up to, but excluding, end"""
+
+    def setUp(self):
+        self.calculator = TaiyiCalculator()
+        self.start = datetime(2024, 3, 5, 10, 30)
+
+    def test_end_is_excluded(self):
+        end = self.start + timedelta(hours=3)
+        divinations = self.calculator.perform_divination_range(self.start, end, step_hours=1)
+        self.assertEqual(
+            [divination.query_date for divination in divinations],
+            [self.start + timedelta(hours=hours) for hours in range(3)],
+        )
+
+    def test_partial_last_step(self):
+        end = self.start + timedelta(days=2, hours=1)
+        divinations = self.calculator.perform_divination_range(self.start, end)
+        self.assertEqual(len(divinations), 3)
+        self.assertLess(divinations[-1].query_date, end)
+
+    def test_empty_range(self):
+        self.assertEqual(self.calculator.perform_divination_range(self.start, self.start), [])
+
+    def test_non_positive_step_raises(self):
+        end = self.start + timedelta(days=1)
+        for step_hours in (0, -1):
+            with self.assertRaises(ValueError):
+                self.calculator.perform_divination_range(self.start, end, step_hours=step_hours)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from divination import trigrams
+from divination.trigrams import get_eight_trigrams, get_nine_palaces
+
+
+class TrigramValuesTest(unittest.TestCase):
+    """Practices and associations are read by attribute or, as with the old dicts, by name"""
+
+    def setUp(self):
+        self.trigram = get_eight_trigrams().get_by_chinese("乾")
+
+    def test_lookup_by_name(self):
+        practices = self.trigram.cultivation_practices
+        associations = self.trigram.symbolic_associations
+        self.assertEqual(practices["physical"], practices.physical)
+        self.assertEqual(practices["spiritual"], practices.spiritual)
+        self.assertEqual(associations["body_part"], associations.body_part)
+        self.assertEqual(associations["landscape"], associations.landscape)
+
+    def test_unknown_name_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.trigram.cultivation_practices["emotional"]
+        with self.assertRaises(KeyError):
+            self.trigram.symbolic_associations["color"]
+
+
+class SharedContainersTest(unittest.TestCase):
+    """EIGHT_TRIGRAMS and NINE_PALACES are the instances the factory functions share"""
+
+    def test_module_names_share_factory_instances(self):
+        self.assertIs(trigrams.EIGHT_TRIGRAMS, get_eight_trigrams())
+        self.assertIs(trigrams.NINE_PALACES, get_nine_palaces())
+
+    def test_unknown_module_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            trigrams.TEN_PALACES
+
+
+if __name__ == "__main__":
+    unittest.main()